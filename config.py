@@ -97,7 +97,10 @@ VIDEO_IDS_FILE = VIDEO_IDS_DIR / "all_video_ids.json"
 VIDEO_IDS_ONLY_FILE = VIDEO_IDS_DIR / "video_ids_only.txt"
 METADATA_FILE = METADATA_DIR / "video_metadata.json"
 CHUNKS_FILE = CHUNKS_DIR / "all_chunks.json"
-EMBEDDINGS_FILE = EMBEDDINGS_DIR / "youtube_embeddings.json"
+EMBEDDINGS_FILE = EMBEDDINGS_DIR / "youtube_embeddings.jsonl"
+EMBEDDINGS_META_FILE = EMBEDDINGS_DIR / "youtube_embeddings.meta.json"
+EMBEDDINGS_VECTORS_FILE = EMBEDDINGS_DIR / "youtube_embeddings.vectors.bin"
+EMBEDDINGS_PARQUET_FILE = EMBEDDINGS_DIR / "youtube_embeddings.parquet"
 
 # Progress tracking files
 TRANSCRIPT_PROGRESS_FILE = TRANSCRIPTS_DIR / "progress.json"
@@ -126,7 +129,7 @@ TRANSCRIPT_DELAY = 2.0        # Delay between requests (seconds)
 TRANSCRIPT_MAX_RETRIES = 3
 
 # Pinecone upload settings
-PINECONE_BATCH_SIZE = 100
+PINECONE_BATCH_SIZE = 1000    # Max vectors per upsert (requests also kept under 2MB)
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -40,12 +40,18 @@ HOW IT WORKS
 2. GET UPLOADS PLAYLIST
    - Every YouTube channel has a hidden "uploads" playlist
    - Contains all public videos in upload order
-   - Playlist ID is derived from channel ID (UC... → UU...)
+   - Playlist ID is derived from channel ID (UC... → UU...) without an API
+     call; channels.list is only used for non-standard channel IDs
+   - Resolution is cached for 30 days in data/video_ids/channel_cache.json
 
 3. PAGINATE THROUGH PLAYLIST
    - YouTube API returns max 50 items per request
    - Script automatically paginates through all videos
    - Extracts video ID, title, description, publish date, thumbnail
+   - Rate limits (429) and server errors are retried with backoff
+   - Progress is saved to data/video_ids/extract_resume.json after every
+     page; if the daily quota runs out the script exits with code 75 and
+     the next run resumes from the saved page token
 
 4. CATEGORIZE VIDEOS
    - Attempts to classify videos by content type
@@ -104,12 +110,14 @@ REQUIREMENTS
 ================================================================================
 
 Prerequisites:
-    - Python 3.8+
+    - Python 3.10+
     - config.py in project root (created by yt_ai_search_setup.sh)
     - YouTube Data API key in .env file
 
 Dependencies:
-    - google-api-python-client
+    - httpx[http2] (pooled HTTP/2 client for the YouTube Data API)
+    - pandas (vectorized categorization)
+    - orjson (fast JSON output)
 
 API Key Setup:
     1. Go to https://console.cloud.google.com/
@@ -125,20 +133,19 @@ API QUOTA
 YouTube Data API has a daily quota of 10,000 units (free tier).
 
 Cost per operation:
-- search.list: 100 units (only used if CHANNEL_ID not set)
-- channels.list: 1 unit (used once to get uploads playlist)
+- search.list: 100 units (only used if CHANNEL_ID not set and not cached)
+- channels.list: 1 unit (only for channel IDs not in UC... form)
 - playlistItems.list: 1 unit per request (50 videos each)
 
 Example for 1,500 videos WITH CHANNEL_ID set:
-- Playlist ID: 1 unit
+- Playlist ID: 0 units (derived from channel ID)
 - Video extraction: 30 requests × 1 unit = 30 units
-- Total: ~31 units (much cheaper than handle search!)
+- Total: ~30 units (much cheaper than handle search!)
 
-Example for 1,500 videos WITHOUT CHANNEL_ID:
+Example for 1,500 videos WITHOUT CHANNEL_ID (first run):
 - Channel lookup: 100 units
-- Playlist ID: 1 unit
 - Video extraction: 30 requests × 1 unit = 30 units
-- Total: ~131 units
+- Total: ~130 units (later runs reuse the cached lookup: ~30 units)
 
 ================================================================================
 CATEGORIZATION LOGIC
@@ -146,7 +153,7 @@ CATEGORIZATION LOGIC
 
 The script attempts to categorize videos based on title/description patterns:
 
-- bible_teaching: Contains book names (Genesis, Matthew, etc.)
+- bible_teaching: Contains book names as whole words (Genesis, Matthew, etc.)
 - qa_session: Contains "Q&A", "questions", etc.
 - sermon: Contains "sermon", "Sunday", "church"
 - special: Interviews, special topics
@@ -176,11 +183,22 @@ from config import (
 """
 
 import argparse
-import json
 import logging
+import random
+import re
 import sys
-from datetime import datetime
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
+import httpx
+import numpy as np
+import orjson
+import pandas as pd
 
 # =============================================================================
 # PATH SETUP
@@ -208,46 +226,210 @@ from config import (
     get_log_file,
 )
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# Handle → channel → uploads playlist resolution rarely changes, so cache it
+# to avoid re-paying search.list (100 units) and channels.list on every run
+CHANNEL_CACHE_FILE = VIDEO_IDS_DIR / "channel_cache.json"
+CHANNEL_CACHE_TTL = timedelta(days=30)
+
+# Pagination state, rewritten after every page so an interrupted extraction
+# picks up from the last page token instead of starting over
+RESUME_FILE = VIDEO_IDS_DIR / "extract_resume.json"
+
+# Transient errors (rate limiting, server hiccups) are retried with
+# exponential backoff; quotaExceeded is not, since it only resets daily
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+MAX_API_RETRIES = 5
+MAX_BACKOFF_SECONDS = 64
+
+# EX_TEMPFAIL: daily quota ran out; re-run after the reset to resume
+EXIT_QUOTA_EXCEEDED = 75
+
+# Thumbnail sizes in order of preference (best first)
+THUMBNAIL_QUALITIES = ('maxres', 'standard', 'high', 'medium', 'default')
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
 
 def setup_logging():
-    """Configure logging with file and console handlers."""
+    """
+    Configure logging with file and console handlers.
+    
+    Idempotent: if the root logger is already configured (e.g. this module
+    was imported by a pipeline driver), no new handlers are attached. Checking
+    first also avoids opening a FileHandler that basicConfig would discard.
+    """
+    if logging.getLogger().handlers:
+        return logging.getLogger(__name__)
+    
     ensure_directories()
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler(get_log_file('01_extract_video_ids')),
-            logging.StreamHandler()
+            logging.StreamHandler(sys.stderr)
         ]
     )
     return logging.getLogger(__name__)
 
 logger = setup_logging()
 
+# =============================================================================
+# DATA MODEL
+# =============================================================================
+
+@dataclass(slots=True)
+class VideoRecord:
+    """
+    One video from the uploads playlist.
+    
+    Slotted rather than a dict per video: no per-instance __dict__, and field
+    access is a fixed offset instead of a hash lookup. orjson serializes
+    dataclasses natively, in field order, so the JSON output is unchanged.
+    """
+    
+    video_id: str
+    title: str
+    description: str
+    published_at: str
+    thumbnail_url: Optional[str]
+    channel_title: str
+    playlist_position: int
+    category: str
+    url: str
+
+
 # =============================================================================
 # YOUTUBE API HELPERS
 # =============================================================================
 
-def get_youtube_client():
-    """Initialize YouTube API client."""
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError(
-            "google-api-python-client not installed!\n"
-            "Run: pip install google-api-python-client"
+class YouTubeClient:
+    """
+    Thin YouTube Data API v3 client over a pooled HTTP/2 connection.
+    
+    google-api-python-client opens an httplib2 connection per client with no
+    pooling or HTTP/2. This wraps only the list endpoints the script needs
+    and reuses one httpx.Client (and its TLS session) for every request.
+    """
+    
+    def __init__(self, api_key):
+        self.http = httpx.Client(
+            base_url=YOUTUBE_API_BASE_URL,
+            http2=True,
+            timeout=30,
+            # Header rather than ?key= so the key never appears in logged URLs
+            headers={'X-Goog-Api-Key': api_key},
         )
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self.http.close()
+    
+    def _get(self, resource, **params):
+        """
+        GET a resource and return the parsed JSON, raising on HTTP errors.
+        
+        429s, 5xxs and per-user rate limit 403s are retried with exponential
+        backoff plus jitter (honoring Retry-After when present). A 403
+        quotaExceeded is raised immediately - waiting seconds won't help.
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        for attempt in range(MAX_API_RETRIES + 1):
+            response = self.http.get(f"/{resource}", params=params)
+            
+            if attempt < MAX_API_RETRIES and is_retryable(response):
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = min(2 ** attempt, MAX_BACKOFF_SECONDS) + random.random()
+                logger.warning(
+                    f"YouTube API returned {response.status_code} for {resource}; "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_API_RETRIES})"
+                )
+                time.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            return response.json()
+    
+    # Each call passes a `fields` mask so the API strips everything we don't
+    # read before serializing; playlistItems pages shrink by well over half.
+    
+    def search_channels(self, query):
+        return self._get(
+            'search',
+            part='snippet',
+            q=query,
+            type='channel',
+            maxResults=1,
+            fields='items/snippet(channelId,title)',
+        )
+    
+    def list_channels(self, channel_id):
+        return self._get(
+            'channels',
+            part='contentDetails',
+            id=channel_id,
+            fields='items/contentDetails/relatedPlaylists/uploads',
+        )
+    
+    def list_playlist_items(self, playlist_id, page_token=None):
+        return self._get(
+            'playlistItems',
+            part='snippet,contentDetails',
+            playlistId=playlist_id,
+            maxResults=50,  # Maximum allowed
+            pageToken=page_token,
+            fields=(
+                'nextPageToken,'
+                'items(contentDetails/videoId,'
+                'snippet(title,description,publishedAt,thumbnails,channelTitle,position))'
+            ),
+        )
+
+
+def is_retryable(response):
+    """True if a failed response is worth retrying after a backoff."""
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        return True
+    return response.status_code == 403 and any(
+        reason in response.text for reason in RATE_LIMIT_REASONS
+    )
+
+
+def is_quota_exceeded(error):
+    """True if an API error means the daily quota is used up."""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code == 403
+        and 'quotaExceeded' in error.response.text
+    )
+
+
+def get_youtube_client():
+    """Initialize YouTube API client."""
     if not YOUTUBE_API_KEY:
         raise ValueError(
             "YOUTUBE_API_KEY not found!\n"
             "Add to .env file: YOUTUBE_API_KEY=AIza...\n"
             "Get key from: https://console.cloud.google.com/"
         )
-    return build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+    return YouTubeClient(YOUTUBE_API_KEY)
 
 
 def get_channel_id(youtube, handle):
@@ -256,31 +438,24 @@ def get_channel_id(youtube, handle):
     
     The handle is the @username format (e.g., @AlbertMohler)
     """
-    from googleapiclient.errors import HttpError
-    
     logger.info(f"Looking up channel ID for handle: {handle}")
     
     # Remove @ if present
     handle_clean = handle.lstrip('@')
     
     try:
-        request = youtube.search().list(
-            part="snippet",
-            q=handle_clean,
-            type="channel",
-            maxResults=1
-        )
-        response = request.execute()
+        response = youtube.search_channels(handle_clean)
         
-        if response['items']:
-            channel_id = response['items'][0]['snippet']['channelId']
-            channel_title = response['items'][0]['snippet']['title']
+        items = response.get('items', [])
+        if items:
+            channel_id = items[0]['snippet']['channelId']
+            channel_title = items[0]['snippet']['title']
             logger.info(f"Found channel: {channel_title} (ID: {channel_id})")
             return channel_id
         else:
             raise ValueError(f"No channel found for handle: {handle}")
             
-    except HttpError as e:
+    except httpx.HTTPError as e:
         logger.error(f"YouTube API error: {e}")
         raise
 
@@ -292,161 +467,368 @@ def get_uploads_playlist_id(youtube, channel_id):
     Every YouTube channel has a hidden 'uploads' playlist containing all their videos.
     The playlist ID is derived from the channel ID by replacing 'UC' with 'UU'.
     """
-    from googleapiclient.errors import HttpError
-    
     logger.info(f"Getting uploads playlist for channel: {channel_id}")
     
     try:
-        request = youtube.channels().list(
-            part="contentDetails",
-            id=channel_id
-        )
-        response = request.execute()
+        response = youtube.list_channels(channel_id)
         
-        if response['items']:
-            uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        items = response.get('items', [])
+        if items:
+            uploads_playlist_id = items[0]['contentDetails']['relatedPlaylists']['uploads']
             logger.info(f"Uploads playlist ID: {uploads_playlist_id}")
             return uploads_playlist_id
         else:
             raise ValueError(f"No channel found with ID: {channel_id}")
             
-    except HttpError as e:
+    except httpx.HTTPError as e:
         logger.error(f"YouTube API error: {e}")
         raise
 
 
+def uploads_playlist_from_channel_id(channel_id):
+    """
+    Derive the uploads playlist ID from a channel ID without an API call.
+    
+    Returns None if the channel ID isn't in the usual UC... form.
+    """
+    if channel_id.startswith('UC'):
+        return 'UU' + channel_id[2:]
+    return None
+
+
+def load_channel_cache():
+    """Load cached channel resolutions keyed by channel ID or handle."""
+    if not CHANNEL_CACHE_FILE.exists():
+        return {}
+    try:
+        return orjson.loads(CHANNEL_CACHE_FILE.read_bytes())
+    except orjson.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable channel cache: {CHANNEL_CACHE_FILE}")
+        return {}
+
+
+def save_channel_cache(cache):
+    """Save channel resolutions cache."""
+    CHANNEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CHANNEL_CACHE_FILE.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+
+
+def resolve_channel(youtube):
+    """
+    Resolve the channel ID and uploads playlist ID.
+    
+    Uses CHANNEL_ID from config when set, otherwise searches by handle. A
+    fresh entry in the on-disk cache skips the API calls entirely.
+    
+    Returns:
+        (channel_id, uploads_playlist_id)
+    """
+    cache_key = CHANNEL_ID or CHANNEL_HANDLE
+    cache = load_channel_cache()
+    cached = cache.get(cache_key)
+    
+    if cached:
+        cached_at = datetime.fromisoformat(cached['cached_at'])
+        if datetime.now() - cached_at < CHANNEL_CACHE_TTL:
+            logger.info(f"Using cached channel resolution for {cache_key} "
+                        f"(cached {cached_at:%Y-%m-%d})")
+            return cached['channel_id'], cached['uploads_playlist_id']
+    
+    # Use CHANNEL_ID directly if available, otherwise search by handle
+    if CHANNEL_ID:
+        logger.info(f"Using CHANNEL_ID from config: {CHANNEL_ID}")
+        channel_id = CHANNEL_ID
+    else:
+        logger.warning("CHANNEL_ID not set in config - searching by handle (less reliable)")
+        logger.warning("Tip: Set CHANNEL_ID in config.py for more reliable results")
+        channel_id = get_channel_id(youtube, CHANNEL_HANDLE)
+    
+    uploads_playlist_id = uploads_playlist_from_channel_id(channel_id)
+    if uploads_playlist_id:
+        logger.info(f"Uploads playlist ID: {uploads_playlist_id} (derived from channel ID)")
+    else:
+        uploads_playlist_id = get_uploads_playlist_id(youtube, channel_id)
+    
+    cache[cache_key] = {
+        'channel_id': channel_id,
+        'uploads_playlist_id': uploads_playlist_id,
+        'cached_at': datetime.now().isoformat(),
+    }
+    save_channel_cache(cache)
+    
+    return channel_id, uploads_playlist_id
+
+
+def parse_playlist_items(items):
+    """
+    Convert raw playlistItems resources into VideoRecords.
+    
+    channel_title is identical on every item, so it's interned: each
+    record points at one shared string instead of its own copy.
+    """
+    videos = []
+    for item in items:
+        snippet = item['snippet']
+        video_id = item['contentDetails']['videoId']
+        videos.append(VideoRecord(
+            video_id=video_id,
+            title=snippet['title'],
+            description=snippet.get('description', '')[:500],
+            published_at=snippet['publishedAt'],
+            thumbnail_url=get_best_thumbnail(snippet.get('thumbnails', {})),
+            channel_title=sys.intern(snippet['channelTitle']),
+            playlist_position=snippet['position'],
+            category='unknown',  # Assigned by enrich_video_data()
+            url=f"https://www.youtube.com/watch?v={video_id}"
+        ))
+    return videos
+
+
+def load_resume_state(playlist_id):
+    """
+    Load saved pagination state for this playlist, if any.
+    
+    Returns (page_token, videos) or None. State saved for a different
+    playlist (e.g. after changing CHANNEL_ID) is ignored.
+    """
+    if not RESUME_FILE.exists():
+        return None
+    
+    try:
+        state = orjson.loads(RESUME_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Could not read resume file, starting over: {e}")
+        return None
+    
+    if state.get('playlist_id') != playlist_id:
+        logger.warning(f"Ignoring resume file for a different playlist: {state.get('playlist_id')}")
+        return None
+    
+    videos = [VideoRecord(**video) for video in state['videos_so_far']]
+    return state['next_page_token'], videos
+
+
+def save_resume_state(playlist_id, page_token, videos):
+    """
+    Atomically persist pagination state.
+    
+    Written to a temp file and renamed over the old one, so a crash
+    mid-write never leaves a truncated resume file behind.
+    """
+    state = {
+        'playlist_id': playlist_id,
+        'next_page_token': page_token,
+        'saved_at': datetime.now().isoformat(),
+        'videos_so_far': videos,
+    }
+    tmp_file = RESUME_FILE.with_suffix('.tmp')
+    tmp_file.write_bytes(orjson.dumps(state))
+    tmp_file.replace(RESUME_FILE)
+
+
 def get_all_video_ids(youtube, playlist_id, limit=None):
     """
     Get all video IDs from a playlist with pagination.
     
     YouTube API returns max 50 items per request, so we need to paginate.
+    Each page is parsed on a background thread while the request for the
+    next page is in flight, so parsing overlaps with network latency.
+    
+    Full extractions (no limit) save their progress to RESUME_FILE after
+    every page. If the daily quota runs out, the partial list is returned
+    and the next run continues from the saved page token.
     
     Args:
         youtube: YouTube API client
         playlist_id: The uploads playlist ID
         limit: Optional maximum number of videos to retrieve
-    """
-    from googleapiclient.errors import HttpError
     
+    Returns:
+        (videos, complete) - complete is False if the quota ran out
+    """
     logger.info(f"Extracting video IDs from playlist: {playlist_id}")
     if limit:
         logger.info(f"Limit mode: extracting first {limit} videos")
     
+    # Limited runs are quick test extractions; don't let them touch the
+    # resume state of a real one
+    resumable = not limit
+    
     videos = []
     next_page_token = None
+    if resumable:
+        resume_state = load_resume_state(playlist_id)
+        if resume_state:
+            next_page_token, videos = resume_state
+            logger.info(f"Resuming from saved page token ({len(videos)} videos already extracted)")
+    
+    # New uploads shift a newest-first playlist's pages, so a resumed run can
+    # be handed videos it already has; keep only the first copy of each
+    seen_ids = {video.video_id for video in videos}
+    
+    def add_page(page):
+        new = [video for video in page if video.video_id not in seen_ids]
+        seen_ids.update(video.video_id for video in new)
+        videos.extend(new)
+        if len(new) < len(page):
+            logger.info(f"Skipped {len(page) - len(new)} videos already extracted")
+    
+    total_items = len(videos)
     page_count = 0
-    
-    while True:
-        try:
-            request = youtube.playlistItems().list(
-                part="snippet,contentDetails",
-                playlistId=playlist_id,
-                maxResults=50,  # Maximum allowed
-                pageToken=next_page_token
-            )
-            response = request.execute()
+    complete = True
+    pending_page = None
+    
+    # A single worker keeps pages parsed in order; the overlap comes from the
+    # main thread waiting on the network, not from parallel parsing.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            try:
+                response = youtube.list_playlist_items(playlist_id, page_token=next_page_token)
+                
+            except httpx.HTTPError as e:
+                if is_quota_exceeded(e):
+                    logger.error(f"YouTube API quota exceeded on page {page_count + 1}")
+                    if resumable:
+                        logger.error(f"Progress saved to {RESUME_FILE}; re-run after the daily quota reset")
+                    complete = False
+                    break
+                logger.error(f"YouTube API error on page {page_count + 1}: {e}")
+                raise
             
             page_count += 1
             
-            for item in response['items']:
-                video_data = {
-                    'video_id': item['contentDetails']['videoId'],
-                    'title': item['snippet']['title'],
-                    'description': item['snippet'].get('description', '')[:500],
-                    'published_at': item['snippet']['publishedAt'],
-                    'thumbnail_url': get_best_thumbnail(item['snippet'].get('thumbnails', {})),
-                    'channel_title': item['snippet']['channelTitle'],
-                    'playlist_position': item['snippet']['position']
-                }
-                videos.append(video_data)
-                
-                if limit and len(videos) >= limit:
-                    logger.info(f"Reached limit of {limit} videos")
-                    return videos
+            # The previous page was parsed while this one was being fetched
+            if pending_page is not None:
+                add_page(pending_page.result())
+                pending_page = None
+            
+            # Checkpoint before this page: everything parsed so far, plus
+            # the token that fetches this page again if we're interrupted
+            if resumable:
+                save_resume_state(playlist_id, next_page_token, videos)
+            
+            # Partial responses omit `items` entirely when a page is empty
+            items = response.get('items', [])
+            if limit:
+                items = items[:limit - total_items]
+            total_items += len(items)
+            pending_page = executor.submit(parse_playlist_items, items)
             
-            logger.info(f"Page {page_count}: Retrieved {len(response['items'])} videos (Total: {len(videos)})")
+            logger.info(f"Page {page_count}: Retrieved {len(items)} videos (Total: {total_items})")
+            
+            if limit and total_items >= limit:
+                logger.info(f"Reached limit of {limit} videos")
+                break
             
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
-                
-        except HttpError as e:
-            logger.error(f"YouTube API error on page {page_count}: {e}")
-            raise
+    
+    if pending_page is not None:
+        add_page(pending_page.result())
+    
+    if not complete:
+        return videos, False
+    
+    if resumable:
+        RESUME_FILE.unlink(missing_ok=True)
     
     logger.info(f"✓ Completed: {len(videos)} total videos extracted")
-    return videos
+    return videos, True
 
 
 def get_best_thumbnail(thumbnails):
     """Get the best quality thumbnail URL available."""
-    for quality in ['maxres', 'standard', 'high', 'medium', 'default']:
-        if quality in thumbnails:
-            return thumbnails[quality]['url']
-    return None
+    return next(
+        (thumbnails[quality]['url'] for quality in THUMBNAIL_QUALITIES if quality in thumbnails),
+        None
+    )
 
 
 # =============================================================================
 # VIDEO CATEGORIZATION
 # =============================================================================
 
-def categorize_video(title, description):
+# Book names are matched as whole words, so "truth" no longer counts as
+# "ruth" or "remarks" as "mark". Plural "psalms" is listed explicitly since
+# substring matching used to cover it via "psalm".
+BIBLE_BOOKS = frozenset([
+    'genesis', 'exodus', 'leviticus', 'numbers', 'deuteronomy',
+    'joshua', 'judges', 'ruth', 'samuel', 'kings', 'chronicles',
+    'ezra', 'nehemiah', 'esther', 'job', 'psalm', 'psalms', 'proverbs',
+    'ecclesiastes', 'isaiah', 'jeremiah',
+    'lamentations', 'ezekiel', 'daniel', 'hosea', 'joel', 'amos',
+    'obadiah', 'jonah', 'micah', 'nahum', 'habakkuk', 'zephaniah',
+    'haggai', 'zechariah', 'malachi', 'matthew', 'mark', 'luke',
+    'john', 'acts', 'romans', 'corinthians', 'galatians', 'ephesians',
+    'philippians', 'colossians', 'thessalonians', 'timothy', 'titus',
+    'philemon', 'hebrews', 'james', 'peter', 'jude', 'revelation'
+])
+MULTIWORD_BIBLE_BOOKS = ('song of solomon',)
+
+# Compiled once at import so each title/description is scanned in a single
+# pass; the (?<![a-z])...(?![a-z]) guards only match book names as whole words
+QA_RE = re.compile(r'q ?& ?a|questions')
+BIBLE_BOOKS_RE = re.compile(
+    r'(?<![a-z])(?:'
+    + '|'.join(map(re.escape, sorted(BIBLE_BOOKS) + list(MULTIWORD_BIBLE_BOOKS)))
+    + r')(?![a-z])'
+)
+SERMON_RE = re.compile(r'sermon|sunday|church')
+
+
+def enrich_video_data(videos):
     """
-    Attempt to categorize video based on title/description.
+    Assign a content category to each video.
     
-    Categories:
-    - bible_teaching: Verse-by-verse commentary
-    - qa_session: Q&A format
-    - sermon: Church sermons
-    - special: Special topics, interviews, etc.
+    Categories, in priority order:
+    - qa_session: Q&A format (title)
+    - bible_teaching: Verse-by-verse commentary (book name in title or description)
+    - sermon: Church sermons (title)
     - unknown: Cannot determine
-    """
-    title_lower = title.lower()
-    desc_lower = description.lower()
-    
-    bible_books = [
-        'genesis', 'exodus', 'leviticus', 'numbers', 'deuteronomy',
-        'joshua', 'judges', 'ruth', 'samuel', 'kings', 'chronicles',
-        'ezra', 'nehemiah', 'esther', 'job', 'psalm', 'proverbs',
-        'ecclesiastes', 'song of solomon', 'isaiah', 'jeremiah',
-        'lamentations', 'ezekiel', 'daniel', 'hosea', 'joel', 'amos',
-        'obadiah', 'jonah', 'micah', 'nahum', 'habakkuk', 'zephaniah',
-        'haggai', 'zechariah', 'malachi', 'matthew', 'mark', 'luke',
-        'john', 'acts', 'romans', 'corinthians', 'galatians', 'ephesians',
-        'philippians', 'colossians', 'thessalonians', 'timothy', 'titus',
-        'philemon', 'hebrews', 'james', 'peter', 'jude', 'revelation'
-    ]
     
-    if 'q&a' in title_lower or 'q & a' in title_lower or 'questions' in title_lower:
-        return 'qa_session'
+    Categorization runs column-wise over all titles/descriptions at once.
+    Rules are applied in priority order and each one only searches the rows
+    no earlier rule has claimed, so the description scan (by far the
+    longest text) is skipped for every video whose title already decided it.
     
-    for book in bible_books:
-        if book in title_lower:
-            return 'bible_teaching'
+    Returns:
+        (videos, category_counts) - the counts are reused for the summary
+    """
+    logger.info("Enriching video data with categories...")
     
-    if any(book in desc_lower for book in bible_books):
-        return 'bible_teaching'
+    # Lowercase each column once; the patterns are all lowercase, so the
+    # matches below can run case-sensitively instead of re-folding per pattern
+    titles = pd.Series([v.title for v in videos], dtype=str).str.lower()
+    descriptions = pd.Series([v.description for v in videos], dtype=str).str.lower()
     
-    if 'sermon' in title_lower or 'sunday' in title_lower or 'church' in title_lower:
-        return 'sermon'
+    rules = (
+        ('qa_session', titles, QA_RE),
+        ('bible_teaching', titles, BIBLE_BOOKS_RE),
+        ('bible_teaching', descriptions, BIBLE_BOOKS_RE),
+        ('sermon', titles, SERMON_RE),
+    )
     
-    return 'unknown'
-
-
-def enrich_video_data(videos):
-    """Add derived fields to video data."""
-    logger.info("Enriching video data with categories...")
+    categories = np.full(len(videos), 'unknown', dtype=object)
+    undecided = np.ones(len(videos), dtype=bool)
     
-    category_counts = {}
+    for category, column, pattern in rules:
+        rows = np.flatnonzero(undecided)
+        if not len(rows):
+            break
+        matched = rows[column.iloc[rows].str.contains(pattern).to_numpy(dtype=bool)]
+        categories[matched] = category
+        undecided[matched] = False
     
-    for video in videos:
-        category = categorize_video(video['title'], video['description'])
-        video['category'] = category
-        video['url'] = f"https://www.youtube.com/watch?v={video['video_id']}"
-        category_counts[category] = category_counts.get(category, 0) + 1
+    # Intern so every record shares one string per category label
+    labels = categories.tolist()
+    for video, category in zip(videos, labels):
+        video.category = sys.intern(category)
     
-    logger.info(f"Category distribution: {category_counts}")
-    return videos
+    category_counts = Counter(labels)
+    
+    logger.info(f"Category distribution: {dict(category_counts)}")
+    return videos, category_counts
 
 
 # =============================================================================
@@ -454,26 +836,36 @@ def enrich_video_data(videos):
 # =============================================================================
 
 def save_results(videos, channel_id):
-    """Save video data to JSON file."""
+    """
+    Save video data to JSON file.
+    
+    The header is written first and each video is then encoded and written
+    on its own line, so the full document is never built in memory on top
+    of the video list itself.
+    """
     VIDEO_IDS_FILE.parent.mkdir(parents=True, exist_ok=True)
     
-    result = {
+    header = {
         'extraction_date': datetime.now().isoformat(),
         'channel_handle': CHANNEL_HANDLE,
         'channel_id': channel_id,
         'channel_display_name': CHANNEL_DISPLAY_NAME,
         'total_videos': len(videos),
-        'videos': videos
     }
     
-    with open(VIDEO_IDS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    with open(VIDEO_IDS_FILE, 'wb') as f:
+        # Reopen the header object (drop its closing "\n}") to append "videos"
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2])
+        f.write(b',\n  "videos": [')
+        for i, video in enumerate(videos):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(orjson.dumps(video))
+        f.write(b'\n  ]\n}\n')
     
     logger.info(f"✓ Saved {len(videos)} videos to {VIDEO_IDS_FILE}")
     
     with open(VIDEO_IDS_ONLY_FILE, 'w') as f:
-        for video in videos:
-            f.write(f"{video['video_id']}\n")
+        f.writelines(video.video_id + '\n' for video in videos)
     
     logger.info(f"✓ Saved video IDs list to {VIDEO_IDS_ONLY_FILE}")
 
@@ -525,20 +917,17 @@ def main():
         return
     
     try:
-        youtube = get_youtube_client()
+        with get_youtube_client() as youtube:
+            channel_id, uploads_playlist_id = resolve_channel(youtube)
+            videos, complete = get_all_video_ids(youtube, uploads_playlist_id, limit=args.limit)
         
-        # Use CHANNEL_ID directly if available, otherwise search by handle
-        if CHANNEL_ID:
-            logger.info(f"Using CHANNEL_ID from config: {CHANNEL_ID}")
-            channel_id = CHANNEL_ID
-        else:
-            logger.warning("CHANNEL_ID not set in config - searching by handle (less reliable)")
-            logger.warning("Tip: Set CHANNEL_ID in config.py for more reliable results")
-            channel_id = get_channel_id(youtube, CHANNEL_HANDLE)
+        if not complete:
+            # Leave the previous outputs in place rather than hand a partial
+            # video list to the later steps; the resume file has the progress
+            logger.error(f"Extraction incomplete: {len(videos)} videos so far, outputs not updated")
+            sys.exit(EXIT_QUOTA_EXCEEDED)
         
-        uploads_playlist_id = get_uploads_playlist_id(youtube, channel_id)
-        videos = get_all_video_ids(youtube, uploads_playlist_id, limit=args.limit)
-        videos = enrich_video_data(videos)
+        videos, categories = enrich_video_data(videos)
         save_results(videos, channel_id)
         
         # Summary
@@ -549,14 +938,9 @@ def main():
         logger.info(f"Total videos: {len(videos)}")
         logger.info(f"Output file: {VIDEO_IDS_FILE}")
         
-        categories = {}
-        for v in videos:
-            cat = v['category']
-            categories[cat] = categories.get(cat, 0) + 1
-        
         logger.info("")
         logger.info("Category Breakdown:")
-        for cat, count in sorted(categories.items(), key=lambda x: -x[1]):
+        for cat, count in categories.most_common():
             logger.info(f"  {cat}: {count} videos")
         
     except Exception as e:
@@ -24,11 +24,13 @@ HOW IT WORKS
 1. LOAD VIDEO IDS
    - Reads all_video_ids.json from Step 01
    - Contains basic info: video_id, title, description, publish date
+   - Streamed with ijson when installed, so batching starts before the
+     whole file is parsed
 
 2. BATCH API REQUESTS
    - YouTube API allows up to 50 video IDs per request
    - Script batches IDs efficiently to minimize API calls
-   - Small delay between batches to respect rate limits
+   - Up to 8 batches are in flight at once over one HTTP/2 connection
 
 3. FETCH DETAILED METADATA
    For each video, retrieves:
@@ -44,7 +46,8 @@ HOW IT WORKS
 
 5. SAVE RESULTS
    - video_metadata.json: All videos with full metadata
-   - Includes summary statistics for the channel
+   - Videos are written as each batch returns, not held until the end
+   - Summary statistics for the channel follow the videos array
 
 ================================================================================
 INPUT FORMAT (from Script 01)
@@ -75,17 +78,6 @@ data/metadata/video_metadata.json:
     "fetch_date": "2025-01-15T11:00:00",
     "channel_handle": "@AlbertMohler",
     "channel_display_name": "Albert Mohler",
-    "total_videos": 1547,
-    "total_duration_seconds": 2847600,
-    "total_duration_formatted": "791:00:00",
-    "estimated_total_chunks": 38234,
-    "duration_distribution": {
-        "very_short": 23,
-        "short": 145,
-        "medium": 892,
-        "long": 412,
-        "very_long": 75
-    },
     "videos": [
         {
             "video_id": "abc123xyz",
@@ -103,7 +95,18 @@ data/metadata/video_metadata.json:
             "estimated_chunks": 25,
             ...
         }
-    ]
+    ],
+    "total_videos": 1547,
+    "total_duration_seconds": 2847600,
+    "total_duration_formatted": "791:00:00",
+    "estimated_total_chunks": 38234,
+    "duration_distribution": {
+        "very_short": 23,
+        "short": 145,
+        "medium": 892,
+        "long": 412,
+        "very_long": 75
+    }
 }
 
 ================================================================================
@@ -127,7 +130,9 @@ Prerequisites:
     - YouTube Data API key in .env file
 
 Dependencies:
-    - google-api-python-client
+    - httpx[http2] (async HTTP/2 client for the YouTube Data API)
+    - orjson (fast JSON parsing)
+    - ijson (optional, streams the input file)
     - tqdm (for progress bar)
 
 API Key Setup:
@@ -199,14 +204,25 @@ from config import (
 """
 
 import argparse
-import json
+import asyncio
+import heapq
 import logging
-import re
+import math
 import sys
-import time
+from bisect import bisect_right
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+import httpx
+import orjson
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None  # Progress bar is optional; main() warns and runs without it
+
 # =============================================================================
 # PATH SETUP
 # =============================================================================
@@ -234,23 +250,52 @@ from config import (
 # CONSTANTS
 # =============================================================================
 
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
 BATCH_SIZE = 50  # YouTube API allows up to 50 video IDs per request
 
+# videos.list batches kept in flight at once. Requests cost quota, not
+# rate, so this only bounds open connections and buffered responses.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds per ISO 8601 duration designator. videos.list only emits days,
+# hours, minutes and seconds (P1DT2H3M4S), so M is always minutes.
+_DURATION_UNITS = {'D': 86400, 'H': 3600, 'M': 60, 'S': 1}
+
+# Number of most-viewed videos listed in the summary
+TOP_VIEWED_COUNT = 10
+
+# Duration category boundaries (seconds) and the label for each bucket:
+# < 1 min, 1-5 min, 5-30 min, 30-60 min, > 1 hour
+_DUR_BINS = (60, 300, 1800, 3600)
+_DUR_LABELS = ('very_short', 'short', 'medium', 'long', 'very_long')
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
 
 def setup_logging():
-    """Configure logging with file and console handlers."""
+    """
+    Configure logging with file and console handlers.
+    
+    Idempotent: if the root logger is already configured (e.g. this module
+    was imported by a pipeline driver), no new handlers are attached. Checking
+    first also avoids opening a FileHandler that basicConfig would discard.
+    """
+    if logging.getLogger().handlers:
+        return logging.getLogger(__name__)
+    
     ensure_directories()
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler(get_log_file('02_fetch_video_metadata')),
-            logging.StreamHandler()
+            logging.StreamHandler(sys.stderr)
         ]
     )
+    # httpx logs every request at INFO; one line per batch drowns the progress bar
+    logging.getLogger('httpx').setLevel(logging.WARNING)
     return logging.getLogger(__name__)
 
 logger = setup_logging()
@@ -260,22 +305,33 @@ logger = setup_logging()
 # =============================================================================
 
 def get_youtube_client():
-    """Initialize YouTube API client."""
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError(
-            "google-api-python-client not installed!\n"
-            "Run: pip install google-api-python-client"
-        )
+    """
+    Initialize an async HTTP/2 client for the YouTube Data API.
     
+    One pooled connection carries all concurrent videos.list requests.
+    """
     if not YOUTUBE_API_KEY:
         raise ValueError(
             "YOUTUBE_API_KEY not found!\n"
             "Add to .env file: YOUTUBE_API_KEY=AIza...\n"
             "Get key from: https://console.cloud.google.com/"
         )
-    return build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+    return httpx.AsyncClient(
+        base_url=YOUTUBE_API_BASE_URL,
+        http2=True,
+        timeout=30,
+        # Header rather than ?key= so the key never appears in logged URLs
+        headers={'X-Goog-Api-Key': YOUTUBE_API_KEY},
+    )
+
+
+def is_quota_exceeded(error):
+    """True if an API error means the daily quota is used up."""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code == 403
+        and 'quotaExceeded' in error.response.text
+    )
 
 
 def parse_duration(duration_str):
@@ -286,18 +342,27 @@ def parse_duration(duration_str):
         PT1H30M45S -> 5445 seconds
         PT5M30S -> 330 seconds
         PT45S -> 45 seconds
-    """
-    pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-    match = re.match(pattern, duration_str)
+        P1DT2H -> 93600 seconds (streams over 24 hours)
     
-    if not match:
+    A single pass over the characters: digits accumulate into a number that
+    each designator scales and adds to the total. Cheaper than a regex match
+    for a string this short, and unlike the old PT-only pattern it doesn't
+    return 0 for durations with a day component.
+    """
+    if not duration_str.startswith('P'):
         return 0
     
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    seconds = int(match.group(3) or 0)
+    total = 0
+    value = 0
+    for c in duration_str[1:]:
+        if '0' <= c <= '9':
+            value = value * 10 + (ord(c) - 48)
+        elif c in _DURATION_UNITS:
+            total += value * _DURATION_UNITS[c]
+            value = 0
+        # 'T' separates date and time parts and carries no value
     
-    return hours * 3600 + minutes * 60 + seconds
+    return total
 
 
 def format_duration(seconds):
@@ -312,28 +377,33 @@ def format_duration(seconds):
         return f"{minutes}:{secs:02d}"
 
 
-def fetch_video_details(youtube, video_ids):
+async def fetch_video_details(client, video_ids):
     """
     Fetch detailed metadata for a batch of video IDs.
     
     Args:
-        youtube: YouTube API client
+        client: YouTube API client (httpx.AsyncClient)
         video_ids: List of video IDs (max 50)
     
     Returns:
         Dict mapping video_id to metadata
     """
-    from googleapiclient.errors import HttpError
-    
     try:
-        request = youtube.videos().list(
-            part="contentDetails,statistics,snippet",
-            id=','.join(video_ids)
-        )
-        response = request.execute()
+        response = await client.get('/videos', params={
+            'part': 'contentDetails,statistics,snippet',
+            'id': ','.join(video_ids),
+            # Only what's read below; drops thumbnails, localizations, etc.
+            'fields': (
+                'items(id,'
+                'contentDetails(duration,caption),'
+                'statistics(viewCount,likeCount,commentCount),'
+                'snippet(tags,description,categoryId,defaultLanguage,defaultAudioLanguage))'
+            ),
+        })
+        response.raise_for_status()
         
         results = {}
-        for item in response.get('items', []):
+        for item in response.json().get('items', []):
             video_id = item['id']
             
             duration_iso = item['contentDetails'].get('duration', 'PT0S')
@@ -358,41 +428,139 @@ def fetch_video_details(youtube, video_ids):
         
         return results
         
-    except HttpError as e:
-        logger.error(f"YouTube API error: {e}")
+    except httpx.HTTPError as e:
+        if not is_quota_exceeded(e):
+            logger.error(f"YouTube API error: {e}")
         raise
 
 
+async def fetch_metadata_batches(batches):
+    """
+    Fetch metadata for every batch, several requests at a time.
+    
+    Up to MAX_CONCURRENT_REQUESTS batches are in flight; once the window is
+    full the oldest is awaited before the next is sent. The window, rather
+    than gathering every batch at once, keeps streamed input streaming and
+    memory bounded.
+    
+    If the daily quota runs out, batches in the window that had already
+    been fetched keep their metadata, and the rest are still yielded with
+    empty metadata so the output keeps every video.
+    
+    Args:
+        batches: Iterable of lists of video records
+    
+    Yields:
+        (batch_videos, metadata) in input order, metadata keyed by video_id
+    """
+    batches = iter(batches)
+    pending = deque()
+    
+    async with get_youtube_client() as client:
+        try:
+            for batch_videos in batches:
+                batch = [v['video_id'] for v in batch_videos]
+                task = asyncio.create_task(fetch_video_details(client, batch))
+                pending.append((batch_videos, task))
+                
+                if len(pending) >= MAX_CONCURRENT_REQUESTS:
+                    batch_videos, task = pending.popleft()
+                    yield batch_videos, await task
+            
+            while pending:
+                batch_videos, task = pending.popleft()
+                yield batch_videos, await task
+        
+        except httpx.HTTPError as e:
+            if not is_quota_exceeded(e):
+                raise
+            logger.error("API quota exceeded! Try again tomorrow.")
+            # The failed batch was already popped, so it goes out first
+            pending.appendleft((batch_videos, task))
+        
+        finally:
+            # Only cancel requests still in flight; finished ones are kept
+            for _, task in pending:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+    
+    for batch_videos, task in pending:
+        fetched = not task.cancelled() and task.exception() is None
+        yield batch_videos, task.result() if fetched else {}
+    for batch_videos in batches:
+        yield batch_videos, {}
+
+
 # =============================================================================
 # DATA PROCESSING
 # =============================================================================
 
-def load_video_ids():
-    """Load video IDs from extraction output."""
+def iter_videos():
+    """
+    Yield video records from extraction output, in file order.
+    
+    With ijson installed the "videos" array is streamed one record at a
+    time, so the first API batch goes out as soon as 50 records have been
+    parsed rather than after the whole file is in memory. Without it the
+    file is parsed in one go with orjson.
+    """
     if not VIDEO_IDS_FILE.exists():
         raise FileNotFoundError(
             f"Input file not found: {VIDEO_IDS_FILE}\n"
             "Please run 01_extract_video_ids_v2.py first."
         )
     
-    with open(VIDEO_IDS_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    try:
+        import ijson
+    except ImportError:
+        yield from orjson.loads(VIDEO_IDS_FILE.read_bytes())['videos']
+        return
     
-    return data['videos']
+    with open(VIDEO_IDS_FILE, 'rb') as f:
+        yield from ijson.items(f, 'videos.item')
+
+
+def read_total_videos():
+    """
+    Read total_videos from the extraction header, or None if unavailable.
+    
+    Step 01 writes its header keys before the "videos" array, so ijson
+    finds this after parsing only the first few lines. Without ijson this
+    would mean parsing the whole file just for a progress bar total, so
+    it returns None instead.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+    
+    # A missing file is reported by iter_videos() with setup instructions
+    if not VIDEO_IDS_FILE.exists():
+        return None
+    
+    with open(VIDEO_IDS_FILE, 'rb') as f:
+        return next(ijson.items(f, 'total_videos'), None)
+
+
+def _chunked(iterable, size):
+    """Yield successive lists of up to `size` items from any iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 
 def categorize_by_duration(duration_seconds):
-    """Categorize video by duration."""
-    if duration_seconds < 60:
-        return 'very_short'  # < 1 min (likely intros, clips)
-    elif duration_seconds < 300:
-        return 'short'  # 1-5 min
-    elif duration_seconds < 1800:
-        return 'medium'  # 5-30 min
-    elif duration_seconds < 3600:
-        return 'long'  # 30-60 min
-    else:
-        return 'very_long'  # > 1 hour
+    """
+    Categorize video by duration.
+    
+    bisect_right gives the number of boundaries at or below the duration,
+    which is exactly the bucket index (a video of exactly 60s is 'short').
+    """
+    return _DUR_LABELS[bisect_right(_DUR_BINS, duration_seconds)]
 
 
 def estimate_transcript_chunks(duration_seconds, words_per_minute=150, chunk_words=300):
@@ -402,10 +570,104 @@ def estimate_transcript_chunks(duration_seconds, words_per_minute=150, chunk_wor
     Assumes:
     - Average speaking rate of 150 words per minute
     - Target chunk size of ~300 words
+    
+    (seconds / 60 × wpm) / chunk_words, folded into one integer floor
+    division: no float intermediates, and exact at chunk boundaries.
+    """
+    return max(1, duration_seconds * words_per_minute // (60 * chunk_words))
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+async def fetch_and_save_metadata(batches):
     """
-    total_words = (duration_seconds / 60) * words_per_minute
-    estimated_chunks = max(1, int(total_words / chunk_words))
-    return estimated_chunks
+    Fetch metadata and stream the enriched videos to METADATA_FILE.
+    
+    Each video is written as soon as its batch returns, so memory holds a
+    window of batches rather than every record. Summary fields are tallied
+    along the way and written after the "videos" array; JSON readers don't
+    care about key order, so steps 03/04 load the file unchanged. Output
+    goes to a temp file that replaces METADATA_FILE only once complete.
+    
+    Returns:
+        Dict of summary statistics for logging
+    """
+    duration_categories = Counter()
+    total_videos = 0
+    fetched_videos = 0
+    total_duration_seconds = 0
+    total_estimated_chunks = 0
+    with_captions = 0
+    # Min-heap of the TOP_VIEWED_COUNT most-viewed so far, as
+    # (view_count, -position, title): on equal views the earlier video wins
+    top_viewed = []
+    
+    header = {
+        'fetch_date': datetime.now().isoformat(),
+        'channel_handle': CHANNEL_HANDLE,
+        'channel_display_name': CHANNEL_DISPLAY_NAME,
+    }
+    
+    METADATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = METADATA_FILE.with_suffix('.json.tmp')
+    
+    with open(tmp_file, 'wb') as f:
+        # Header keys, then one compact record per line inside "videos"
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2])
+        f.write(b',\n  "videos": [')
+        separator = b'\n    '
+        
+        async for batch_videos, metadata in fetch_metadata_batches(batches):
+            for video in batch_videos:
+                meta = metadata.get(video['video_id'])
+                if meta is not None:
+                    video.update(meta)
+                    
+                    dur_cat = categorize_by_duration(video['duration_seconds'])
+                    video['duration_category'] = dur_cat
+                    duration_categories[dur_cat] += 1
+                    
+                    est_chunks = estimate_transcript_chunks(video['duration_seconds'])
+                    video['estimated_chunks'] = est_chunks
+                    
+                    fetched_videos += 1
+                    total_duration_seconds += video['duration_seconds']
+                    total_estimated_chunks += est_chunks
+                    with_captions += video['caption_available']
+                
+                entry = (video.get('view_count', 0), -total_videos, video['title'])
+                if len(top_viewed) < TOP_VIEWED_COUNT:
+                    heapq.heappush(top_viewed, entry)
+                else:
+                    heapq.heappushpop(top_viewed, entry)
+                total_videos += 1
+                
+                f.write(separator)
+                f.write(orjson.dumps(video))
+                separator = b',\n    '
+        
+        summary = {
+            'total_videos': total_videos,
+            'total_duration_seconds': total_duration_seconds,
+            'total_duration_formatted': format_duration(total_duration_seconds),
+            'estimated_total_chunks': total_estimated_chunks,
+            'duration_distribution': duration_categories,
+        }
+        # Summary keys follow the array; [2:] drops the dump's opening "{\n"
+        f.write(b'\n  ],\n')
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2)[2:])
+        f.write(b'\n')
+    
+    tmp_file.replace(METADATA_FILE)
+    
+    summary.update(
+        fetched_videos=fetched_videos,
+        with_captions=with_captions,
+        top_viewed=sorted(top_viewed, reverse=True),
+    )
+    return summary
 
 
 # =============================================================================
@@ -451,90 +713,37 @@ def main():
         logger.error("Get key from: https://console.cloud.google.com/")
         return
     
-    # Load existing video data
+    # Stream existing video data; records are collected batch by batch
     logger.info(f"Loading video IDs from {VIDEO_IDS_FILE}")
-    videos = load_video_ids()
-    logger.info(f"Loaded {len(videos)} videos")
+    video_iter = iter_videos()
     
     if args.limit:
-        videos = videos[:args.limit]
+        video_iter = islice(video_iter, args.limit)
         logger.info(f"Limit mode: processing first {args.limit} videos")
     
-    # Initialize API client
-    youtube = get_youtube_client()
-    
-    # Extract just the video IDs
-    video_ids = [v['video_id'] for v in videos]
-    
-    # Import tqdm for progress bar
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        logger.warning("tqdm not installed, progress bar disabled")
-        tqdm = lambda x, **kwargs: x
-    
-    # Fetch metadata in batches
+    # Fetch metadata in batches, writing each batch as it arrives
     logger.info(f"Fetching metadata in batches of {BATCH_SIZE}...")
-    all_metadata = {}
-    
-    batches = [video_ids[i:i+BATCH_SIZE] for i in range(0, len(video_ids), BATCH_SIZE)]
-    
-    for batch in tqdm(batches, desc="Fetching metadata"):
-        try:
-            from googleapiclient.errors import HttpError
-            metadata = fetch_video_details(youtube, batch)
-            all_metadata.update(metadata)
-            time.sleep(0.1)  # Small delay to be nice to the API
-            
-        except HttpError as e:
-            if 'quotaExceeded' in str(e):
-                logger.error("API quota exceeded! Try again tomorrow.")
-                break
-            raise
-    
-    logger.info(f"Fetched metadata for {len(all_metadata)} videos")
-    
-    # Merge metadata with original video data
-    enriched_videos = []
-    duration_categories = {}
-    total_duration_seconds = 0
-    total_estimated_chunks = 0
-    
-    for video in videos:
-        vid = video['video_id']
-        if vid in all_metadata:
-            video.update(all_metadata[vid])
-            
-            dur_cat = categorize_by_duration(video['duration_seconds'])
-            video['duration_category'] = dur_cat
-            duration_categories[dur_cat] = duration_categories.get(dur_cat, 0) + 1
-            
-            est_chunks = estimate_transcript_chunks(video['duration_seconds'])
-            video['estimated_chunks'] = est_chunks
-            
-            total_duration_seconds += video['duration_seconds']
-            total_estimated_chunks += est_chunks
-        
-        enriched_videos.append(video)
-    
-    # Save enriched data
-    METADATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    batches = _chunked(video_iter, BATCH_SIZE)
+    
+    if tqdm is not None:
+        total_videos = read_total_videos()
+        if total_videos is not None and args.limit:
+            total_videos = min(total_videos, args.limit)
+        total_batches = math.ceil(total_videos / BATCH_SIZE) if total_videos is not None else None
+        batches = tqdm(batches, total=total_batches, desc="Fetching metadata")
+    else:
+        logger.warning("tqdm not installed, progress bar disabled")
     
-    result = {
-        'fetch_date': datetime.now().isoformat(),
-        'channel_handle': CHANNEL_HANDLE,
-        'channel_display_name': CHANNEL_DISPLAY_NAME,
-        'total_videos': len(enriched_videos),
-        'total_duration_seconds': total_duration_seconds,
-        'total_duration_formatted': format_duration(total_duration_seconds),
-        'estimated_total_chunks': total_estimated_chunks,
-        'duration_distribution': duration_categories,
-        'videos': enriched_videos
-    }
+    summary = asyncio.run(fetch_and_save_metadata(batches))
     
-    with open(METADATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    total_videos = summary['total_videos']
+    total_duration_seconds = summary['total_duration_seconds']
+    total_estimated_chunks = summary['estimated_total_chunks']
+    duration_categories = summary['duration_distribution']
+    with_captions = summary['with_captions']
     
+    logger.info(f"Loaded {total_videos} videos")
+    logger.info(f"Fetched metadata for {summary['fetched_videos']} videos")
     logger.info(f"✓ Saved enriched metadata to {METADATA_FILE}")
     
     # Summary statistics
@@ -542,25 +751,23 @@ def main():
     logger.info("=" * 60)
     logger.info("METADATA FETCH COMPLETE")
     logger.info("=" * 60)
-    logger.info(f"Total videos: {len(enriched_videos)}")
+    logger.info(f"Total videos: {total_videos}")
     logger.info(f"Total duration: {format_duration(total_duration_seconds)} ({total_duration_seconds / 3600:.1f} hours)")
     logger.info(f"Estimated total chunks: {total_estimated_chunks:,}")
     
     logger.info("")
     logger.info("Duration Distribution:")
-    for cat in ['very_short', 'short', 'medium', 'long', 'very_long']:
-        count = duration_categories.get(cat, 0)
+    for cat in _DUR_LABELS:
+        count = duration_categories[cat]
         if count > 0:
             logger.info(f"  {cat}: {count} videos")
     
-    with_captions = sum(1 for v in enriched_videos if v.get('caption_available', False))
-    logger.info(f"\nVideos with captions: {with_captions} ({100*with_captions/len(enriched_videos):.1f}%)")
+    logger.info(f"\nVideos with captions: {with_captions} ({100*with_captions/max(total_videos, 1):.1f}%)")
     
     logger.info("")
-    logger.info("Top 10 Most Viewed Videos:")
-    sorted_by_views = sorted(enriched_videos, key=lambda x: x.get('view_count', 0), reverse=True)
-    for i, v in enumerate(sorted_by_views[:10], 1):
-        logger.info(f"  {i}. {v['title'][:55]}... ({v.get('view_count', 0):,} views)")
+    logger.info(f"Top {TOP_VIEWED_COUNT} Most Viewed Videos:")
+    for i, (view_count, _, title) in enumerate(summary['top_viewed'], 1):
+        logger.info(f"  {i}. {title[:55]}... ({view_count:,} views)")
     
     # Embedding cost estimate
     estimated_tokens = total_estimated_chunks * 400
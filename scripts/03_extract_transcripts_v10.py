@@ -74,6 +74,7 @@ USAGE
 REQUIREMENTS
 ================================================================================
     - youtube-transcript-api (pip install youtube-transcript-api)
+    - orjson (pip install orjson)
     - Output from 02_fetch_video_metadata.py (video_metadata.json)
     - Webshare account with rotating residential proxies
     - WEBSHARE_PROXY_USERNAME and WEBSHARE_PROXY_PASSWORD in .env file
@@ -127,7 +128,6 @@ TROUBLESHOOTING
 """
 
 import sys
-import json
 import random
 import time
 import logging
@@ -135,6 +135,8 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 # Add project root to path for config import
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -238,6 +240,16 @@ def get_api_instance():
 # DATA LOADING AND PROGRESS TRACKING
 # =============================================================================
 
+def _load_json(path):
+    """Parse a JSON file with orjson (reads bytes, no text decode step)."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _dump_json(path, obj):
+    """Write obj to path as indented JSON with orjson."""
+    Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
 def load_metadata():
     """
     Load video metadata from step 02 output.
@@ -254,8 +266,7 @@ def load_metadata():
             "Please run 02_fetch_video_metadata.py first."
         )
     
-    with open(METADATA_FILE, 'r') as f:
-        data = json.load(f)
+    data = _load_json(METADATA_FILE)
     
     videos_list = data.get("videos", [])
     return {video["video_id"]: video for video in videos_list}
@@ -275,12 +286,11 @@ def load_progress():
         dict: Progress tracking data with lists for each category
     """
     if TRANSCRIPT_PROGRESS_FILE.exists():
-        with open(TRANSCRIPT_PROGRESS_FILE, 'r') as f:
-            data = json.load(f)
-            # Ensure all expected keys exist (for backward compatibility)
-            if "blocked" not in data:
-                data["blocked"] = []
-            return data
+        data = _load_json(TRANSCRIPT_PROGRESS_FILE)
+        # Ensure all expected keys exist (for backward compatibility)
+        if "blocked" not in data:
+            data["blocked"] = []
+        return data
     
     # Initialize empty progress if file doesn't exist
     return {"completed": [], "failed": [], "no_transcript": [], "blocked": []}
@@ -296,8 +306,7 @@ def save_progress(progress):
     Args:
         progress: Progress dict to save
     """
-    with open(TRANSCRIPT_PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+    _dump_json(TRANSCRIPT_PROGRESS_FILE, progress)
 
 
 def transcript_file_exists(video_id):
@@ -605,8 +614,7 @@ def extract_all_transcripts(batch_size=100, delay=None, limit=None, retry_blocke
             
             # Save to file
             output_file = TRANSCRIPTS_DIR / f"{video_id}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(transcript_data, f, ensure_ascii=False, indent=2)
+            _dump_json(output_file, transcript_data)
             
             progress["completed"].append(video_id)
             
@@ -28,6 +28,8 @@ HOW IT WORKS
 
 2. LOAD METADATA
    - Gets video metadata (titles, thumbnails, durations) from video_metadata.json
+   - The fields used are cached in .video_metadata_cache.pkl next to it and
+     reused until video_metadata.json changes
    - Used to enrich chunks with display information
 
 3. CHUNK ALGORITHM
@@ -49,6 +51,8 @@ HOW IT WORKS
 
 5. SAVE OUTPUT
    - all_chunks.json: Complete array of all chunks
+   - Chunks are streamed to disk as each transcript is processed; totals
+     are written after the array, once known
    - chunking_progress.json: Track which videos have been processed
 
 ================================================================================
@@ -75,8 +79,6 @@ OUTPUT FORMAT
 data/chunks/all_chunks.json:
 {
     "created_at": "2025-01-15T10:30:00",
-    "total_chunks": 5432,
-    "total_videos": 287,
     "chunks": [
         {
             "chunk_id": "yt-abc123-0000",
@@ -96,7 +98,9 @@ data/chunks/all_chunks.json:
             "embedding_text": "Video Title | 0:00\n\nHello everyone welcome..."
         },
         ...
-    ]
+    ],
+    "total_chunks": 5432,
+    "total_videos": 287
 }
 
 ================================================================================
@@ -115,6 +119,9 @@ Incremental mode (only process new transcripts):
 Combined:
     python 04_chunk_transcripts_v2.py --incremental --limit 50
 
+Transcripts are chunked in parallel, one worker process per CPU by default:
+    python 04_chunk_transcripts_v2.py --workers 4
+
 ================================================================================
 REQUIREMENTS
 ================================================================================
@@ -125,6 +132,10 @@ Prerequisites:
     - Completed Step 03 (transcript files exist)
     - Completed Step 02 (video_metadata.json exists)
 
+Dependencies:
+    - orjson (fast JSON parsing and writing)
+    - ijson (optional, streams existing chunks in incremental mode)
+
 No external API calls - this is local processing only.
 
 ================================================================================
@@ -142,12 +153,18 @@ Shorter chunks lose context; longer chunks dilute search relevance.
 """
 
 import argparse
-import json
 import logging
+import mmap
+import os
+import pickle
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 # =============================================================================
 # PATH SETUP
 # =============================================================================
@@ -176,6 +193,27 @@ from config import (
     get_log_file,
 )
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Parsed subset of METADATA_FILE, reused until step 02 rewrites the JSON
+METADATA_CACHE_FILE = METADATA_FILE.with_name(".video_metadata_cache.pkl")
+
+# The only per-video metadata fields chunking reads
+METADATA_FIELDS = ("thumbnail_url",)
+
+# Files at least this big are parsed straight from a memory map instead of
+# being read into a bytes object first; below it the mapping isn't worth it
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Runs of whitespace (newlines, doubled spaces) inside caption text
+_WS_RE = re.compile(r"\s+")
+
+# Transcripts handed to a worker process per round trip; amortizes IPC
+# without starving workers at the end of a run
+WORKER_CHUNKSIZE = 16
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -199,33 +237,79 @@ logger = setup_logging()
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _load_json(path):
+    """
+    Parse a JSON file with orjson (reads bytes, no text decode step).
+    
+    Large files (MMAP_MIN_BYTES and up, e.g. multi-hour transcripts or
+    all_chunks.json) are memory-mapped and parsed in place, skipping the
+    copy into a bytes object.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dump_json(path, obj):
+    """Write obj to path as indented JSON with orjson."""
+    Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
 def load_metadata():
-    """Load video metadata for thumbnails and other info."""
-    with open(METADATA_FILE, 'r') as f:
-        data = json.load(f)
-    videos_list = data.get("videos", [])
-    return {video["video_id"]: video for video in videos_list}
+    """
+    Load video metadata for thumbnails and other info.
+    
+    Only METADATA_FIELDS are kept. The result is pickled to
+    METADATA_CACHE_FILE, keyed by the JSON file's size and mtime, so runs
+    that follow without a new step 02 skip re-parsing the whole file.
+    """
+    stat = METADATA_FILE.stat()
+    source_key = (stat.st_size, stat.st_mtime_ns)
+    
+    if METADATA_CACHE_FILE.exists():
+        try:
+            cached = pickle.loads(METADATA_CACHE_FILE.read_bytes())
+            if cached["source"] == source_key and cached["fields"] == METADATA_FIELDS:
+                return cached["videos"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable metadata cache: {e}")
+    
+    data = _load_json(METADATA_FILE)
+    metadata = {
+        video["video_id"]: {field: video[field] for field in METADATA_FIELDS if field in video}
+        for video in data.get("videos", [])
+    }
+    
+    try:
+        METADATA_CACHE_FILE.write_bytes(pickle.dumps(
+            {"source": source_key, "fields": METADATA_FIELDS, "videos": metadata},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        ))
+    except OSError as e:
+        logger.warning(f"Could not write metadata cache: {e}")
+    
+    return metadata
 
 
 def load_progress():
     """Load chunking progress."""
     if CHUNKS_PROGRESS_FILE.exists():
-        with open(CHUNKS_PROGRESS_FILE, 'r') as f:
-            return json.load(f)
+        return _load_json(CHUNKS_PROGRESS_FILE)
     return {"processed": [], "failed": []}
 
 
 def save_progress(progress):
     """Save chunking progress."""
-    with open(CHUNKS_PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+    _dump_json(CHUNKS_PROGRESS_FILE, progress)
 
 
 def format_timestamp(seconds):
     """Convert seconds to human-readable timestamp."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
     
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -259,17 +343,27 @@ def chunk_transcript(transcript_data, video_metadata):
     if not segments:
         return []
     
+    # Pull each field out into its own list (struct-of-arrays) in tight
+    # comprehensions, so the scan below zips plain values instead of doing
+    # three dict lookups per segment inside the loop body
+    texts = [segment["text"].strip() for segment in segments]
+    starts = [segment["start"] for segment in segments]
+    durations = [segment.get("duration", 2.0) for segment in segments]
+    
+    # Per-video fields, identical on every chunk
+    title = transcript_data.get("title", "")
+    channel = transcript_data.get("channel", CHANNEL_DISPLAY_NAME)
+    video_duration = transcript_data.get("duration_seconds", 0)
+    thumbnail_url = video_metadata.get("thumbnail_url", "")
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    
     chunks = []
     current_chunk_text = []
-    current_chunk_start = segments[0]["start"]
+    current_chunk_start = starts[0]
     current_chunk_duration = 0
     chunk_index = 0
     
-    for segment in segments:
-        segment_text = segment["text"].strip()
-        segment_start = segment["start"]
-        segment_duration = segment.get("duration", 2.0)
-        
+    for segment_text, segment_start, segment_duration in zip(texts, starts, durations):
         # Skip empty segments
         if not segment_text:
             continue
@@ -277,35 +371,21 @@ def chunk_transcript(transcript_data, video_metadata):
         # Check if adding this segment would exceed max duration
         potential_duration = (segment_start + segment_duration) - current_chunk_start
         
-        # If we've reached target duration and have content, finalize chunk
-        if current_chunk_duration >= TARGET_CHUNK_DURATION and current_chunk_text:
+        # Finalize the chunk once it has reached the target duration, or
+        # if adding this segment would push it past the max
+        if current_chunk_text and (current_chunk_duration >= TARGET_CHUNK_DURATION
+                                   or potential_duration > MAX_CHUNK_DURATION):
             chunk = create_chunk(
                 video_id=video_id,
                 chunk_index=chunk_index,
                 text=current_chunk_text,
                 start_time=current_chunk_start,
                 end_time=segment_start,
-                transcript_data=transcript_data,
-                video_metadata=video_metadata
-            )
-            chunks.append(chunk)
-            chunk_index += 1
-            
-            # Start new chunk
-            current_chunk_text = [segment_text]
-            current_chunk_start = segment_start
-            current_chunk_duration = segment_duration
-        
-        # If adding would exceed max, force new chunk
-        elif potential_duration > MAX_CHUNK_DURATION and current_chunk_text:
-            chunk = create_chunk(
-                video_id=video_id,
-                chunk_index=chunk_index,
-                text=current_chunk_text,
-                start_time=current_chunk_start,
-                end_time=segment_start,
-                transcript_data=transcript_data,
-                video_metadata=video_metadata
+                title=title,
+                channel=channel,
+                video_duration=video_duration,
+                thumbnail_url=thumbnail_url,
+                video_url=video_url
             )
             chunks.append(chunk)
             chunk_index += 1
@@ -322,8 +402,7 @@ def chunk_transcript(transcript_data, video_metadata):
     
     # Don't forget the last chunk
     if current_chunk_text:
-        last_segment = segments[-1]
-        end_time = last_segment["start"] + last_segment.get("duration", 2.0)
+        end_time = starts[-1] + durations[-1]
         
         # Only create if meets minimum duration (or it's the only content)
         if current_chunk_duration >= MIN_CHUNK_DURATION or chunk_index == 0:
@@ -333,8 +412,11 @@ def chunk_transcript(transcript_data, video_metadata):
                 text=current_chunk_text,
                 start_time=current_chunk_start,
                 end_time=end_time,
-                transcript_data=transcript_data,
-                video_metadata=video_metadata
+                title=title,
+                channel=channel,
+                video_duration=video_duration,
+                thumbnail_url=thumbnail_url,
+                video_url=video_url
             )
             chunks.append(chunk)
         elif chunks:
@@ -347,15 +429,20 @@ def chunk_transcript(transcript_data, video_metadata):
     return chunks
 
 
-def create_chunk(video_id, chunk_index, text, start_time, end_time, 
-                 transcript_data, video_metadata):
-    """Create a chunk dict with all necessary metadata."""
+def create_chunk(video_id, chunk_index, text, start_time, end_time,
+                 title, channel, video_duration, thumbnail_url, video_url):
+    """
+    Create a chunk dict with all necessary metadata.
     
-    # Combine segment texts
-    combined_text = " ".join(text)
+    The video-level fields (title through video_url) are looked up once per
+    video by chunk_transcript and passed in as-is.
+    """
+    
+    # Combine segment texts, collapsing whitespace runs to single spaces
+    # (same result as " ".join(s.split()), without the intermediate list)
+    combined_text = _WS_RE.sub(" ", " ".join(text)).strip()
     
-    # Clean up text (remove multiple spaces, etc.)
-    combined_text = " ".join(combined_text.split())
+    start_timestamp = format_timestamp(start_time)
     
     return {
         "chunk_id": f"yt-{video_id}-{chunk_index:04d}",
@@ -368,31 +455,154 @@ def create_chunk(video_id, chunk_index, text, start_time, end_time,
         # Timestamps
         "start_time": start_time,
         "end_time": end_time,
-        "start_timestamp": format_timestamp(start_time),
+        "start_timestamp": start_timestamp,
         "end_timestamp": format_timestamp(end_time),
         "duration_seconds": end_time - start_time,
         
         # Video metadata
-        "video_title": transcript_data.get("title", ""),
-        "channel": transcript_data.get("channel", CHANNEL_DISPLAY_NAME),
-        "video_duration_seconds": transcript_data.get("duration_seconds", 0),
-        "thumbnail_url": video_metadata.get("thumbnail_url", ""),
+        "video_title": title,
+        "channel": channel,
+        "video_duration_seconds": video_duration,
+        "thumbnail_url": thumbnail_url,
         
         # Links
         "youtube_url": create_youtube_link(video_id, start_time),
-        "video_url": f"https://www.youtube.com/watch?v={video_id}",
+        "video_url": video_url,
         
         # For embedding context
-        "embedding_text": f"{transcript_data.get('title', '')} | {format_timestamp(start_time)}\n\n{combined_text}"
+        "embedding_text": f"{title} | {start_timestamp}\n\n{combined_text}"
     }
 
 
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def iter_existing_chunks():
+    """
+    Yield the chunks already in CHUNKS_FILE, in order.
+    
+    Streamed with ijson when installed (floats kept as float, not Decimal,
+    so orjson can re-encode them); otherwise parsed in one go with orjson.
+    """
+    try:
+        import ijson
+    except ImportError:
+        yield from _load_json(CHUNKS_FILE).get("chunks", [])
+        return
+    
+    with open(CHUNKS_FILE, 'rb') as f:
+        yield from ijson.items(f, 'chunks.item', use_float=True)
+
+
+class ChunkWriter:
+    """
+    Stream chunks into CHUNKS_FILE without holding them all in memory.
+    
+    Header keys are written up front, then one compact chunk per line
+    inside "chunks", then the totals, which are only known at the end.
+    Output goes to a temp file that replaces CHUNKS_FILE on a clean exit,
+    so an interrupted run leaves the previous file intact (and readable
+    for incremental mode's copy of existing chunks).
+    
+    Also keeps the running stats the summary needs: chunk count, distinct
+    videos, and total/min/max chunk duration.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_suffix(".json.tmp")
+        self.total_chunks = 0
+        self.video_ids = set()
+        self.total_duration = 0
+        self.min_duration = None
+        self.max_duration = None
+        self._separator = b"\n    "
+    
+    def __enter__(self):
+        header = {
+            "created_at": datetime.now().isoformat(),
+            "channel_handle": CHANNEL_HANDLE,
+            "channel_display_name": CHANNEL_DISPLAY_NAME,
+            "chunking_parameters": {
+                "target_duration": TARGET_CHUNK_DURATION,
+                "min_duration": MIN_CHUNK_DURATION,
+                "max_duration": MAX_CHUNK_DURATION,
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.tmp_path, 'wb')
+        self._file.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2])
+        self._file.write(b',\n  "chunks": [')
+        return self
+    
+    def write(self, chunks):
+        """Append chunks to the output and fold them into the stats."""
+        for chunk in chunks:
+            self._file.write(self._separator)
+            self._file.write(orjson.dumps(chunk))
+            self._separator = b",\n    "
+            
+            duration = chunk["duration_seconds"]
+            self.total_chunks += 1
+            self.video_ids.add(chunk["video_id"])
+            self.total_duration += duration
+            if self.min_duration is None or duration < self.min_duration:
+                self.min_duration = duration
+            if self.max_duration is None or duration > self.max_duration:
+                self.max_duration = duration
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._file.close()
+            self.tmp_path.unlink()
+            return False
+        
+        totals = {
+            "total_chunks": self.total_chunks,
+            "total_videos": len(self.video_ids),
+        }
+        # [2:] drops the dump's opening "{\n" so the keys continue the object
+        self._file.write(b"\n  ],\n")
+        self._file.write(orjson.dumps(totals, option=orjson.OPT_INDENT_2)[2:])
+        self._file.write(b"\n")
+        self._file.close()
+        self.tmp_path.replace(self.path)
+        return False
+
+
 # =============================================================================
 # MAIN PROCESSING
 # =============================================================================
 
-def process_all_transcripts(limit=None, incremental=False):
-    """Process all transcript files into chunks."""
+def _process_one(payload):
+    """
+    Load and chunk one transcript file.
+    
+    Runs in a worker process, so it's a top-level function taking one
+    picklable argument: (transcript_file, video_meta). Errors come back as
+    a message rather than an exception, so one bad file doesn't abort the
+    whole map.
+    
+    Returns:
+        (title, chunks, error) - error is None on success
+    """
+    transcript_file, video_meta = payload
+    try:
+        transcript_data = _load_json(transcript_file)
+        return transcript_data.get("title", ""), chunk_transcript(transcript_data, video_meta), None
+    except Exception as e:
+        return None, [], str(e)
+
+
+def process_all_transcripts(limit=None, incremental=False, workers=None):
+    """
+    Process all transcript files into chunks.
+    
+    Transcripts are chunked in parallel across `workers` processes
+    (default: one per CPU). Results come back in file order, so the
+    output is the same as a serial run.
+    """
     
     logger.info("=" * 60)
     logger.info("Starting Transcript Chunking")
@@ -429,72 +639,45 @@ def process_all_transcripts(limit=None, incremental=False):
         logger.info("No new transcripts to process!")
         return
     
-    # Load existing chunks if incremental
-    all_chunks = []
-    if incremental and CHUNKS_FILE.exists():
-        with open(CHUNKS_FILE, 'r') as f:
-            existing_data = json.load(f)
-            all_chunks = existing_data.get("chunks", [])
-        logger.info(f"Loaded {len(all_chunks)} existing chunks")
-    
-    # Process each transcript
+    # Process each transcript; workers get only their video's metadata row
     stats = {"processed": 0, "chunks_created": 0, "failed": 0}
+    payloads = [(f, metadata.get(f.stem, {})) for f in transcript_files]
     
-    for i, transcript_file in enumerate(transcript_files, 1):
-        video_id = transcript_file.stem
+    with ChunkWriter(CHUNKS_FILE) as writer, ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_process_one, payloads, chunksize=WORKER_CHUNKSIZE)
         
-        try:
-            # Load transcript
-            with open(transcript_file, 'r') as f:
-                transcript_data = json.load(f)
-            
-            # Get video metadata
-            video_meta = metadata.get(video_id, {})
+        # Carry existing chunks over first if incremental (workers are
+        # already chunking the new transcripts meanwhile)
+        if incremental and CHUNKS_FILE.exists():
+            writer.write(iter_existing_chunks())
+            logger.info(f"Copied {writer.total_chunks} existing chunks")
+        
+        for i, (transcript_file, (title, chunks, error)) in enumerate(zip(transcript_files, results), 1):
+            video_id = transcript_file.stem
             
-            # Create chunks
-            chunks = chunk_transcript(transcript_data, video_meta)
+            if error is not None:
+                logger.error(f"[{i}/{len(transcript_files)}] ✗ {video_id} - Error: {error}")
+                progress["failed"].append(video_id)
+                stats["failed"] += 1
             
-            if chunks:
-                all_chunks.extend(chunks)
+            elif chunks:
+                writer.write(chunks)
                 progress["processed"].append(video_id)
                 stats["processed"] += 1
                 stats["chunks_created"] += len(chunks)
                 
                 logger.info(f"[{i}/{len(transcript_files)}] ✓ {video_id} - "
-                           f"{transcript_data.get('title', '')[:40]}... "
+                           f"{title[:40]}... "
                            f"({len(chunks)} chunks)")
             else:
                 logger.warning(f"[{i}/{len(transcript_files)}] ⚠ {video_id} - No segments found")
                 progress["failed"].append(video_id)
                 stats["failed"] += 1
-                
-        except Exception as e:
-            logger.error(f"[{i}/{len(transcript_files)}] ✗ {video_id} - Error: {e}")
-            progress["failed"].append(video_id)
-            stats["failed"] += 1
-        
-        # Save progress every 100 files
-        if i % 100 == 0:
-            save_progress(progress)
-            logger.info(f"--- Progress saved: {stats['chunks_created']} chunks created ---")
-    
-    # Save all chunks
-    output_data = {
-        "created_at": datetime.now().isoformat(),
-        "channel_handle": CHANNEL_HANDLE,
-        "channel_display_name": CHANNEL_DISPLAY_NAME,
-        "total_chunks": len(all_chunks),
-        "total_videos": len(set(c["video_id"] for c in all_chunks)),
-        "chunking_parameters": {
-            "target_duration": TARGET_CHUNK_DURATION,
-            "min_duration": MIN_CHUNK_DURATION,
-            "max_duration": MAX_CHUNK_DURATION,
-        },
-        "chunks": all_chunks
-    }
-    
-    with open(CHUNKS_FILE, 'w') as f:
-        json.dump(output_data, f, indent=2)
+            
+            # Save progress every 100 files
+            if i % 100 == 0:
+                save_progress(progress)
+                logger.info(f"--- Progress saved: {stats['chunks_created']} chunks created ---")
     
     # Final progress save
     save_progress(progress)
@@ -507,16 +690,15 @@ def process_all_transcripts(limit=None, incremental=False):
     logger.info(f"Transcripts processed: {stats['processed']}")
     logger.info(f"Chunks created: {stats['chunks_created']}")
     logger.info(f"Failed: {stats['failed']}")
-    logger.info(f"Total chunks in output: {len(all_chunks)}")
+    logger.info(f"Total chunks in output: {writer.total_chunks}")
     logger.info(f"Output file: {CHUNKS_FILE}")
     
     # Chunk stats
-    if all_chunks:
-        durations = [c["duration_seconds"] for c in all_chunks]
-        avg_duration = sum(durations) / len(durations)
+    if writer.total_chunks:
+        avg_duration = writer.total_duration / writer.total_chunks
         logger.info(f"Average chunk duration: {avg_duration:.1f}s")
-        logger.info(f"Min chunk duration: {min(durations):.1f}s")
-        logger.info(f"Max chunk duration: {max(durations):.1f}s")
+        logger.info(f"Min chunk duration: {writer.min_duration:.1f}s")
+        logger.info(f"Max chunk duration: {writer.max_duration:.1f}s")
 
 
 # =============================================================================
@@ -533,6 +715,7 @@ Examples:
     python 04_chunk_transcripts_v2.py                  # Process all transcripts
     python 04_chunk_transcripts_v2.py --limit 10       # Process first 10 transcripts
     python 04_chunk_transcripts_v2.py --incremental    # Only process new transcripts
+    python 04_chunk_transcripts_v2.py --workers 4      # Use 4 worker processes
         """
     )
     
@@ -548,6 +731,13 @@ Examples:
         help='Only process transcripts not already chunked'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for chunking (default: one per CPU)'
+    )
+    
     return parser.parse_args()
 
 
@@ -557,4 +747,4 @@ Examples:
 
 if __name__ == "__main__":
     args = parse_args()
-    process_all_transcripts(limit=args.limit, incremental=args.incremental)
+    process_all_transcripts(limit=args.limit, incremental=args.incremental, workers=args.workers)
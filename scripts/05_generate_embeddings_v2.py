@@ -22,22 +22,43 @@ HOW IT WORKS
 ================================================================================
 
 1. LOAD CHUNKS
-   - Reads all_chunks.json from Step 04
+   - Streams all_chunks.json from Step 04 (with ijson installed)
    - Each chunk has text content and metadata
+   - Only chunks still to be embedded are kept in memory, so an
+     incremental run holds just the new ones
 
 2. BATCH PROCESSING
-   - Groups chunks into batches (default: 100 per batch)
-   - Sends batches to OpenAI API
-   - Batching is more efficient than one-at-a-time
+   - Counts each chunk's tokens exactly with tiktoken
+   - Truncates any embedding text over 8,000 tokens (the API rejects
+     inputs over 8,191, failing the whole batch); --no-truncate-oversized
+     leaves those chunks out instead
+   - Groups chunks into batches (default: 100 per batch, and at most
+     250,000 tokens per batch - the API caps a request at 300,000)
+   - Sends batches to OpenAI API, up to 8 requests in flight at once:
+     8 workers pull batches from a small queue and hand results to a
+     single writer, which saves each one as soon as it arrives
+   - Batching is more efficient than one-at-a-time, and overlapping
+     requests hides the network round-trip of each one
+   - Chunks whose embedding text repeats one already embedded (recurring
+     intros, re-uploads) are not sent again; they share its vector.
+     The text fingerprints are kept with the progress files, so this
+     carries across incremental runs
 
 3. GENERATE EMBEDDINGS
    - Uses text-embedding-3-small model (1536 dimensions)
    - Embeds the "embedding_text" field (title + timestamp + content)
-   - Returns vector of 1536 floats per chunk
+   - Returns vector of 1536 floats per chunk (sent base64-encoded)
 
 4. SAVE RESULTS
-   - youtube_embeddings.json: Chunks with embedding vectors added
-   - embedding_progress.json: Track which chunks have been processed
+   - youtube_embeddings.jsonl: Chunk metadata, one per line, appended
+     after every batch
+   - youtube_embeddings.vectors.bin: The vectors themselves, as raw
+     float32 rows (float16 with --fp16)
+   - youtube_embeddings.meta.json: Run summary (model, totals, vector dtype)
+   - embedding_progress.*.txt: Track which chunks have been processed
+     (append-only, one line per chunk, written after every batch)
+   - youtube_embeddings.parquet (with --parquet): Every chunk and its
+     vector in one zstd-compressed table, for pandas/polars analysis
 
 ================================================================================
 COST ESTIMATION
@@ -52,6 +73,15 @@ Typical costs:
 - 100,000 chunks: ~$0.30
 
 The script estimates cost before processing and reports actual usage after.
+With tiktoken installed both figures come from exact token counts;
+without it they fall back to a rough 4-characters-per-token guess.
+
+Batch API (--batch-api):
+- Requests are uploaded as a JSONL file and run by OpenAI within 24 hours
+- Billed at 50% of the realtime price, with no rate limits on our side
+- Best for the first full run of a channel; keep realtime for daily
+  incremental updates where results are wanted right away
+- The script keeps running (polling every 60s) until the job finishes
 
 ================================================================================
 INPUT FORMAT (from Script 04)
@@ -75,24 +105,40 @@ data/chunks/all_chunks.json:
 OUTPUT FORMAT
 ================================================================================
 
-data/embeddings/youtube_embeddings.json:
+data/embeddings/youtube_embeddings.jsonl (one chunk per line):
+{"chunk_id": "yt-abc123-0000", "video_id": "abc123", "text": "...", "vector_row": 0, ...}
+{"chunk_id": "yt-abc123-0001", "video_id": "abc123", "text": "...", "vector_row": 1, ...}
+
+data/embeddings/youtube_embeddings.vectors.bin:
+    Raw little-endian rows of 1536 values, one row per embedded chunk.
+    A chunk's vector is row "vector_row". Load with:
+        np.memmap(path, dtype=meta["vector_dtype"], mode="r").reshape(-1, meta["dimensions"])
+
+A float32 row is 6KB against ~25KB for the same vector as JSON text, and
+nothing has to be parsed back from decimal on the way into Pinecone.
+Embeddings are L2-normalized, so --fp16 halves that again while keeping
+cosine similarity accurate to about three decimal places.
+
+Each batch is appended as soon as it is embedded, so a checkpoint never
+re-writes earlier vectors. In incremental mode new chunks are appended
+to the existing files, which are never read back: the totals carry
+over from youtube_embeddings.meta.json.
+
+The first incremental run after upgrading from the single
+youtube_embeddings.json output converts that file (and its
+embedding_progress.json) to this format before embedding anything new.
+
+data/embeddings/youtube_embeddings.meta.json:
 {
     "created_at": "2025-01-15T10:30:00",
+    "channel_handle": "@AlbertMohler",
+    "channel_display_name": "Albert Mohler",
     "model": "text-embedding-3-small",
     "dimensions": 1536,
     "total_chunks": 5432,
     "total_videos": 287,
-    "channel_handle": "@AlbertMohler",
-    "channel_display_name": "Albert Mohler",
-    "chunks": [
-        {
-            "chunk_id": "yt-abc123-0000",
-            "video_id": "abc123",
-            "text": "...",
-            "embedding": [0.0123, -0.0456, 0.0789, ...],  // 1536 floats
-            ...
-        }
-    ]
+    "vector_dtype": "float32",
+    "video_ids": ["abc123", ...]
 }
 
 ================================================================================
@@ -111,6 +157,21 @@ Incremental mode (only process new chunks):
 Custom batch size:
     python 05_generate_embeddings_v2.py --batch-size 50
 
+Fewer requests in flight (lower-tier accounts):
+    python 05_generate_embeddings_v2.py --concurrency 2
+
+Match your account's requests/tokens-per-minute limits (0 disables either):
+    python 05_generate_embeddings_v2.py --rpm 500 --tpm 40000
+
+Bulk first run through the Batch API (half price, results within 24h):
+    python 05_generate_embeddings_v2.py --batch-api
+
+Store vectors as float16 (half the disk and memory):
+    python 05_generate_embeddings_v2.py --fp16
+
+Also export everything to Parquet:
+    python 05_generate_embeddings_v2.py --incremental --parquet
+
 Combined:
     python 05_generate_embeddings_v2.py --incremental --limit 1000 --batch-size 50
 
@@ -126,6 +187,12 @@ Prerequisites:
 
 Dependencies:
     - openai>=1.0.0
+    - httpx[http2] (pooled HTTP/2 connection for the OpenAI client)
+    - orjson>=3.9.0
+    - numpy
+    - tiktoken (optional, exact token counts for batching and pacing)
+    - ijson (optional, streams all_chunks.json instead of loading it whole)
+    - pyarrow (optional, for --parquet)
 
 API Key Setup:
     1. Get API key from https://platform.openai.com/api-keys
@@ -140,9 +207,15 @@ OpenAI has rate limits based on your account tier:
 - Tier 1+: Much higher limits
 
 The script includes:
-- Configurable delay between batches (RATE_LIMIT_DELAY)
-- Automatic retry on rate limit errors (via OpenAI client)
-- Progress saving every 10 batches (resume if interrupted)
+- A cap on concurrent requests (--concurrency, default 8)
+- Token-bucket pacing to --rpm requests and --tpm tokens per minute
+  (defaults 3,000 and 1,000,000, tier 1 for text-embedding-3-small):
+  a full bucket allows an opening burst, then requests go out as fast
+  as the buckets refill
+- Retry of rate limits, timeouts and 5xx errors: up to 6 attempts with
+  randomized exponential backoff; a 429's Retry-After pauses all requests
+- Only batches that fail every attempt are recorded as failed
+- Progress saved after every batch (resume if interrupted)
 
 ================================================================================
 EMBEDDING SETTINGS (from config.py)
@@ -156,13 +229,21 @@ EMBEDDING_BATCH_SIZE = 100                    # Chunks per API call
 """
 
 import argparse
-import json
+import asyncio
+import base64
+import functools
+import hashlib
 import logging
+import os
+import random
 import sys
 import time
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import orjson
+
 # =============================================================================
 # PATH SETUP
 # =============================================================================
@@ -182,6 +263,9 @@ from config import (
     CHUNKS_FILE,
     EMBEDDINGS_DIR,
     EMBEDDINGS_FILE,
+    EMBEDDINGS_META_FILE,
+    EMBEDDINGS_VECTORS_FILE,
+    EMBEDDINGS_PARQUET_FILE,
     EMBEDDINGS_PROGRESS_FILE,
     LOGS_DIR,
     EMBEDDING_MODEL,
@@ -214,67 +298,887 @@ logger = setup_logging()
 # CONSTANTS
 # =============================================================================
 
-RATE_LIMIT_DELAY = 0.1  # Delay between batches (seconds)
+MAX_CONCURRENT_REQUESTS = 8  # Embedding batches in flight at once
+QUEUE_MULTIPLIER = 2         # Batches queued ahead = concurrency x this
+MAX_API_ATTEMPTS = 6         # Tries per batch before its chunks are marked failed
+MAX_BACKOFF_SECONDS = 60     # Cap on the randomized exponential backoff
+MAX_TOKENS_PER_BATCH = 250_000  # Below the API's 300,000 tokens per request
+REQUESTS_PER_MINUTE = 3_000     # Account RPM limit for the embedding model
+TOKENS_PER_MINUTE = 1_000_000   # Account TPM limit for the embedding model
+TOKENIZER_THREADS = 8           # tiktoken releases the GIL while encoding
+HTTP_TIMEOUT_SECONDS = 60       # Per request; connecting gets HTTP_CONNECT_TIMEOUT
+HTTP_CONNECT_TIMEOUT = 10
+MAX_INPUT_TOKENS = 8000         # The API rejects any single input over 8191 tokens
+
+# OpenAI Batch API (--batch-api)
+BATCH_INPUT_FILE = EMBEDDINGS_DIR / "batch_input.jsonl"
+BATCH_API_MAX_INPUTS = 50_000   # Embedding inputs allowed per batch job
+BATCH_API_POLL_SECONDS = 60     # Delay between job status checks
+BATCH_API_DISCOUNT = 0.5        # Batch jobs are billed at half price
+BATCH_API_FINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+PARQUET_ROW_GROUP_SIZE = 10_000  # Chunks per Parquet row group (--parquet)
+
+# Append-only progress files (EMBEDDINGS_PROGRESS_FILE is the older JSON form)
+PROGRESS_IDS_FILE = EMBEDDINGS_PROGRESS_FILE.with_suffix(".ids.txt")
+PROGRESS_FAILED_FILE = EMBEDDINGS_PROGRESS_FILE.with_suffix(".failed.txt")
+PROGRESS_TEXT_ROWS_FILE = EMBEDDINGS_PROGRESS_FILE.with_suffix(".text_rows.txt")
+
+# Single JSON document (vectors inline) written by older versions of this script
+LEGACY_EMBEDDINGS_FILE = EMBEDDINGS_FILE.with_suffix(".json")
+LEGACY_CONVERT_BATCH_SIZE = 10_000  # Chunks converted to vector rows at a time
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def load_progress():
-    """Load embedding progress."""
-    if EMBEDDINGS_PROGRESS_FILE.exists():
-        with open(EMBEDDINGS_PROGRESS_FILE, 'r') as f:
-            return json.load(f)
-    return {"embedded_chunk_ids": [], "failed_chunk_ids": []}
+def _read_lines(path):
+    """Yield the non-blank lines of a text file (nothing if it doesn't exist)."""
+    if not path.exists():
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def load_progress(vector_dtype="float32"):
+    """
+    Load embedding progress.
+    
+    Args:
+        vector_dtype: Row dtype for output converted from an older run
+    
+    Returns:
+        embedded: Set of chunk ids already embedded
+        text_rows: {text_key: vector_row} for text already embedded
+    """
+    migrate_legacy_progress(vector_dtype)
+    embedded = set(_read_lines(PROGRESS_IDS_FILE))
+    text_rows = {}
+    for line in _read_lines(PROGRESS_TEXT_ROWS_FILE):
+        key, row = line.split()
+        text_rows[key] = int(row)
+    return embedded, text_rows
+
+
+def migrate_legacy_progress(vector_dtype="float32"):
+    """
+    Convert an embedding_progress.json left by an older run to the append-only files.
+    
+    Runs from before the JSONL output also left their embeddings in
+    LEGACY_EMBEDDINGS_FILE; those are converted to JSONL records and vector
+    rows first, so an incremental run keeps them. If neither that file nor
+    the JSONL output exists, the old progress is ignored: its chunk ids
+    would be skipped with no embeddings to show for them.
+    """
+    if not EMBEDDINGS_PROGRESS_FILE.exists() or PROGRESS_IDS_FILE.exists():
+        return
+    legacy = orjson.loads(EMBEDDINGS_PROGRESS_FILE.read_bytes())
+    
+    if LEGACY_EMBEDDINGS_FILE.exists():
+        migrate_legacy_embeddings(legacy.get("failed_chunk_ids", []), vector_dtype)
+        return
+    if not EMBEDDINGS_FILE.exists():
+        logger.warning(
+            f"{EMBEDDINGS_PROGRESS_FILE.name} has no saved embeddings to go with it "
+            f"({LEGACY_EMBEDDINGS_FILE.name} is missing); ignoring it"
+        )
+        logger.warning("Run without --incremental to embed every chunk")
+        return
+    
+    with ProgressLog(append=False) as log:
+        log.embedded(legacy.get("embedded_chunk_ids", []))
+        log.failed(legacy.get("failed_chunk_ids", []))
+        for key, row in legacy.get("text_rows", {}).items():
+            log.text_row(key, row)
+    EMBEDDINGS_PROGRESS_FILE.unlink()
+    logger.info(f"Converted {EMBEDDINGS_PROGRESS_FILE.name} to append-only progress files")
+
+
+def migrate_legacy_embeddings(failed_ids, vector_dtype):
+    """
+    Convert LEGACY_EMBEDDINGS_FILE to the JSONL output, vector rows and
+    progress files, replacing whatever output is there.
+    
+    The embedded ids come from the saved chunks themselves, so progress
+    never claims a chunk the output doesn't have.
+    """
+    logger.info(f"Converting {LEGACY_EMBEDDINGS_FILE.name} from an older run...")
+    legacy_chunks = orjson.loads(LEGACY_EMBEDDINGS_FILE.read_bytes()).get("chunks", [])
+    
+    with ProgressLog(append=False) as progress, \
+            EmbeddingWriter(append=False, dtype=vector_dtype) as writer:
+        seen = set()
+        for start in range(0, len(legacy_chunks), LEGACY_CONVERT_BATCH_SIZE):
+            batch = legacy_chunks[start:start + LEGACY_CONVERT_BATCH_SIZE]
+            embeddings = [chunk.pop("embedding") for chunk in batch]
+            first_row = writer.next_row
+            writer.write(batch, embeddings)
+            progress.embedded(chunk["chunk_id"] for chunk in batch)
+            for row, chunk in enumerate(batch, first_row):
+                key = text_key(chunk.get("embedding_text", chunk.get("text", "")))
+                if key not in seen:
+                    seen.add(key)
+                    progress.text_row(key, row)
+        progress.failed(failed_ids)
+    
+    EMBEDDINGS_PROGRESS_FILE.unlink()
+    logger.info(
+        f"Converted {writer.total_chunks} embeddings to {EMBEDDINGS_FILE.name} "
+        f"({LEGACY_EMBEDDINGS_FILE.name} is no longer used and can be deleted)"
+    )
+
+
+class ProgressLog:
+    """
+    Append-only record of embedding progress, one line per entry.
+    
+    PROGRESS_IDS_FILE lists embedded chunk ids, PROGRESS_FAILED_FILE the
+    ones that failed, and PROGRESS_TEXT_ROWS_FILE "<text_key> <vector_row>"
+    for each text embedded. A checkpoint (flush) writes only what the last
+    batch added, instead of re-serializing every id seen so far.
+    
+    Full runs start the files fresh; append mode adds to them.
+    """
+    
+    def __init__(self, append=True):
+        self.append = append
+    
+    def __enter__(self):
+        mode = 'a' if self.append else 'w'
+        self._ids = open(PROGRESS_IDS_FILE, mode, encoding='utf-8')
+        self._failed = open(PROGRESS_FAILED_FILE, mode, encoding='utf-8')
+        self._text_rows = open(PROGRESS_TEXT_ROWS_FILE, mode, encoding='utf-8')
+        return self
+    
+    def embedded(self, chunk_ids):
+        self._ids.writelines(f"{chunk_id}\n" for chunk_id in chunk_ids)
+    
+    def failed(self, chunk_ids):
+        self._failed.writelines(f"{chunk_id}\n" for chunk_id in chunk_ids)
+    
+    def text_row(self, key, row):
+        self._text_rows.write(f"{key} {row}\n")
+    
+    def flush(self):
+        """Push everything written so far to disk."""
+        for f in (self._ids, self._failed, self._text_rows):
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        for f in (self._ids, self._failed, self._text_rows):
+            f.close()
+        return False
+
+
+def iter_chunks():
+    """
+    Yield the chunks in CHUNKS_FILE, in order.
+    
+    Streamed with ijson when installed (floats kept as float, not Decimal,
+    so orjson can re-encode them); otherwise parsed in one go with orjson.
+    """
+    try:
+        import ijson
+    except ImportError:
+        with open(CHUNKS_FILE, 'rb') as f:
+            yield from orjson.loads(f.read()).get("chunks", [])
+        return
+    
+    with open(CHUNKS_FILE, 'rb') as f:
+        yield from ijson.items(f, 'chunks.item', use_float=True)
+
+
+def iter_saved_embeddings():
+    """Stream previously embedded chunks from the JSONL output, one at a time."""
+    if not EMBEDDINGS_FILE.exists():
+        return
+    with open(EMBEDDINGS_FILE, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_meta():
+    """Load the run summary written by save_meta ({} if there is none)."""
+    if EMBEDDINGS_META_FILE.exists():
+        return orjson.loads(EMBEDDINGS_META_FILE.read_bytes())
+    return {}
 
 
-def save_progress(progress):
-    """Save embedding progress."""
-    with open(EMBEDDINGS_PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+def save_meta(total_chunks, video_ids, vector_dtype):
+    """
+    Write the small run summary that sits next to the JSONL output.
+    
+    The video ids are included so an incremental run can pick up the
+    totals from here rather than re-reading every saved record.
+    """
+    meta = {
+        "created_at": datetime.now().isoformat(),
+        "channel_handle": CHANNEL_HANDLE,
+        "channel_display_name": CHANNEL_DISPLAY_NAME,
+        "model": EMBEDDING_MODEL,
+        "dimensions": EMBEDDING_DIMENSIONS,
+        "total_chunks": total_chunks,
+        "total_videos": len(video_ids),
+        "vector_dtype": vector_dtype,
+        "video_ids": sorted(video_ids),
+    }
+    with open(EMBEDDINGS_META_FILE, 'wb') as f:
+        f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
+def get_openai_client(concurrency):
+    """
+    Initialize an AsyncOpenAI client over a pooled HTTP/2 connection.
+    
+    The SDK's default client speaks HTTP/1.1, where each request in flight
+    needs a connection (and TLS handshake) of its own. Over HTTP/2 the
+    concurrent embedding requests share one session.
+    """
+    import httpx
+    from openai import AsyncOpenAI
+    
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=concurrency * 2,
+            max_keepalive_connections=concurrency * 2
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT),
+    )
+    return AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
 
 
-def generate_embeddings_batch(texts, client):
+async def generate_embeddings_batch(texts, client):
     """
     Generate embeddings for a batch of texts.
     
+    Vectors are requested base64-encoded: each arrives as the raw
+    little-endian float32 bytes, about a quarter the size of a JSON float
+    list, and decodes straight into numpy without parsing any floats.
+    
     Args:
         texts: List of strings to embed
-        client: OpenAI client
+        client: AsyncOpenAI client
     
     Returns:
-        List of embedding vectors
+        float32 array of shape (len(texts), dimensions)
     """
-    response = client.embeddings.create(
+    response = await client.embeddings.create(
         model=EMBEDDING_MODEL,
-        input=texts
+        input=texts,
+        encoding_format="base64"
+    )
+    
+    # Decode embeddings in order
+    return decode_embeddings([item.embedding for item in response.data])
+
+
+def decode_embeddings(encoded):
+    """Decode base64 float32 vectors into a (len(encoded), dimensions) array."""
+    return np.stack([np.frombuffer(base64.b64decode(e), dtype="<f4") for e in encoded])
+
+
+class RateLimitPause:
+    """
+    Shared "hold off until" time for every request in the run.
+    
+    Set from a 429's Retry-After: the other requests in flight would hit
+    the same limit, so they all wait instead of piling on more 429s.
+    """
+    
+    def __init__(self):
+        self.until = 0.0
+    
+    def extend(self, seconds):
+        self.until = max(self.until, time.monotonic() + seconds)
+    
+    async def wait(self):
+        delay = self.until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def retry_after_seconds(error):
+    """Read Retry-After (or retry-after-ms) from an API error's response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+async def embed_with_retry(texts, client, pause):
+    """
+    Generate embeddings for a batch, retrying transient failures.
+    
+    Rate limits, timeouts, dropped connections and 5xx errors are retried
+    with randomized exponential backoff, up to MAX_API_ATTEMPTS tries. A
+    Retry-After on a 429 is honored and pauses every request, not just
+    this one. Anything else (bad input, bad key) is raised immediately.
+    """
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    retryable = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    
+    for attempt in range(1, MAX_API_ATTEMPTS + 1):
+        await pause.wait()
+        try:
+            return await generate_embeddings_batch(texts, client)
+        except retryable as e:
+            if attempt == MAX_API_ATTEMPTS:
+                raise
+            delay = retry_after_seconds(e) if isinstance(e, RateLimitError) else None
+            if delay is not None:
+                pause.extend(delay)
+            else:
+                delay = random.uniform(1, min(2 ** attempt, MAX_BACKOFF_SECONDS))
+            logger.warning(
+                f"Embedding request failed ({type(e).__name__}: {e}); "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{MAX_API_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+
+class TokenBucket:
+    """
+    Token-bucket limiter for `per_minute` units (requests or tokens).
+    
+    The bucket holds a minute's allowance and refills continuously, so a
+    run opens with a burst and then paces itself at the limit instead of
+    stalling for whole windows. A request larger than the bucket waits
+    for it to fill. A limit of 0 turns the bucket off.
+    """
+    
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.level = per_minute
+        self.refill_per_second = per_minute / 60
+        self.updated = time.monotonic()
+    
+    async def acquire(self, amount=1):
+        if not self.capacity:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.refill_per_second)
+            self.updated = now
+            if self.level >= amount:
+                self.level -= amount
+                return
+            await asyncio.sleep((amount - self.level) / self.refill_per_second)
+
+
+async def embed_pipeline(batches, batch_tokens, client, concurrency, pause, rpm, tpm, handle):
+    """
+    Embed batches with `concurrency` workers fed from a bounded queue.
+    
+    A producer queues (batch_num, batch, tokens) a few batches ahead of
+    the workers, so only those plus the ones in flight are scheduled at a
+    time. Each worker takes a request from the `rpm` TokenBucket and the
+    batch's tokens from the `tpm` one, then embeds its batch. Results go through a second bounded queue to a single
+    consumer that calls handle(batch_num, batch, tokens, result) in
+    completion order, so writes stay serial. `result` is the vectors, or
+    the exception if the batch still failed after its retries.
+    """
+    jobs = asyncio.Queue(maxsize=concurrency * QUEUE_MULTIPLIER)
+    results = asyncio.Queue(maxsize=concurrency * QUEUE_MULTIPLIER)
+    
+    async def produce():
+        for batch_num, (batch, tokens) in enumerate(zip(batches, batch_tokens), start=1):
+            await jobs.put((batch_num, batch, tokens))
+        for _ in range(concurrency):
+            await jobs.put(None)
+    
+    async def work():
+        while True:
+            job = await jobs.get()
+            if job is None:
+                return
+            batch_num, batch, tokens = job
+            await rpm.acquire()
+            await tpm.acquire(tokens)
+            try:
+                result = await embed_with_retry([c["embedding_text"] for c in batch], client, pause)
+            except Exception as e:
+                result = e
+            await results.put((batch_num, batch, tokens, result))
+    
+    async def consume():
+        for _ in range(len(batches)):
+            handle(*await results.get())
+    
+    await asyncio.gather(produce(), consume(), *[work() for _ in range(concurrency)])
+
+
+async def run_batch_job(batches, client, first_batch_num):
+    """
+    Embed a group of batches through the OpenAI Batch API.
+    
+    Each batch becomes one request line (custom_id "batch-N"), so results
+    line up with the realtime path: an array per batch, or an exception
+    for a request that failed. Blocks until the job reaches a final state.
+    """
+    batch_nums = range(first_batch_num, first_batch_num + len(batches))
+    with open(BATCH_INPUT_FILE, 'wb') as f:
+        for batch_num, batch in zip(batch_nums, batches):
+            f.write(orjson.dumps({
+                "custom_id": f"batch-{batch_num}",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {
+                    "model": EMBEDDING_MODEL,
+                    "input": [c["embedding_text"] for c in batch],
+                    "encoding_format": "base64",
+                },
+            }) + b"\n")
+    
+    with open(BATCH_INPUT_FILE, 'rb') as f:
+        input_file = await client.files.create(file=f, purpose="batch")
+    job = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/embeddings",
+        completion_window="24h"
     )
+    logger.info(f"Submitted Batch API job {job.id} ({len(batches)} requests)")
+    
+    while job.status not in BATCH_API_FINAL_STATES:
+        await asyncio.sleep(BATCH_API_POLL_SECONDS)
+        job = await client.batches.retrieve(job.id)
+        counts = job.request_counts
+        done = f" ({counts.completed}/{counts.total} requests)" if counts else ""
+        logger.info(f"  Batch job {job.id}: {job.status}{done}")
+    
+    results = {}
+    if job.output_file_id:
+        output = await client.files.content(job.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                data = sorted(response["body"]["data"], key=lambda d: d["index"])
+                results[item["custom_id"]] = decode_embeddings([d["embedding"] for d in data])
+            else:
+                error = item.get("error") or response.get("body")
+                results[item["custom_id"]] = RuntimeError(f"Batch API request failed: {error}")
+    
+    missing = RuntimeError(f"Batch API job {job.id} {job.status} without a result for this batch")
+    return [results.get(f"batch-{n}", missing) for n in batch_nums]
+
+
+def text_key(text):
+    """Short fingerprint of an embedding input, used to spot repeated text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def split_duplicates(chunks, text_rows):
+    """
+    Separate chunks that need an API call from repeats of the same text.
+    
+    Args:
+        chunks: Chunks to embed, in order
+        text_rows: {text_key: vector_row} for text already embedded
     
-    # Extract embeddings in order
-    embeddings = [item.embedding for item in response.data]
-    return embeddings
+    Returns:
+        novel: First chunk for each new text (the only ones sent)
+        copies: {text_key: [later chunks repeating that text]}
+        reused: [(chunk, vector_row)] for text embedded by an earlier run
+    """
+    novel, copies, reused = [], {}, []
+    for chunk in chunks:
+        key = text_key(chunk["embedding_text"])
+        if key in text_rows:
+            reused.append((chunk, text_rows[key]))
+        elif key in copies:
+            copies[key].append(chunk)
+        else:
+            copies[key] = []
+            novel.append(chunk)
+    return novel, copies, reused
+
+
+@functools.lru_cache(maxsize=None)
+def get_tokenizer():
+    """Return the tiktoken encoding for EMBEDDING_MODEL, or None if tiktoken is missing."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+    except KeyError:
+        # Unknown to this tiktoken version; OpenAI's embedding models use cl100k_base
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(chunks):
+    """
+    Count the embedding-input tokens of each chunk.
+    
+    Exact with tiktoken (encoded across TOKENIZER_THREADS threads);
+    without it, a rough 4-characters-per-token estimate.
+    
+    Returns:
+        {chunk_id: token count}
+    """
+    texts = [c["embedding_text"] for c in chunks]
+    enc = get_tokenizer()
+    if enc is None:
+        logger.warning("tiktoken not installed; estimating tokens as characters / 4")
+        logger.warning("Run: pip install tiktoken")
+        counts = [max(1, len(t) // 4) for t in texts]
+    else:
+        counts = [len(tokens) for tokens in enc.encode_ordinary_batch(texts, num_threads=TOKENIZER_THREADS)]
+    return {c["chunk_id"]: n for c, n in zip(chunks, counts)}
+
+
+def cap_oversized(chunks, token_counts, truncate=True):
+    """
+    Keep every input under MAX_INPUT_TOKENS, so one long chunk can't fail
+    the whole batch it is sent in.
+    
+    With `truncate`, an oversized chunk's embedding_text is cut to
+    MAX_INPUT_TOKENS tokens (on the chunk itself, so the saved record shows
+    what was embedded) and its token count updated. Otherwise it is left out.
+    
+    Returns:
+        kept: Chunks to embed, in order
+        skipped: Oversized chunks left out (empty when truncating)
+    """
+    kept, skipped = [], []
+    enc = get_tokenizer()
+    for chunk in chunks:
+        chunk_id = chunk["chunk_id"]
+        if token_counts[chunk_id] <= MAX_INPUT_TOKENS:
+            kept.append(chunk)
+            continue
+        if not truncate:
+            logger.warning(f"Skipping {chunk_id}: {token_counts.pop(chunk_id):,} tokens (limit {MAX_INPUT_TOKENS:,})")
+            skipped.append(chunk)
+            continue
+        
+        logger.warning(f"Truncating {chunk_id}: {token_counts[chunk_id]:,} tokens to {MAX_INPUT_TOKENS:,}")
+        text = chunk["embedding_text"]
+        if enc is None:
+            chunk["embedding_text"] = text[:MAX_INPUT_TOKENS * 4]
+        else:
+            chunk["embedding_text"] = enc.decode(enc.encode_ordinary(text)[:MAX_INPUT_TOKENS])
+        token_counts[chunk_id] = MAX_INPUT_TOKENS
+        kept.append(chunk)
+    return kept, skipped
+
+
+def pack_batches(chunks, token_counts, batch_size, max_tokens):
+    """
+    Greedily group chunks into batches of at most `batch_size` chunks and
+    `max_tokens` tokens (a single larger chunk gets a batch to itself).
+    
+    Returns:
+        batches: Lists of chunks, in order
+        batch_tokens: Token total of each batch
+    """
+    batches, batch_tokens = [], []
+    batch, tokens = [], 0
+    for chunk in chunks:
+        n = token_counts[chunk["chunk_id"]]
+        if batch and (len(batch) >= batch_size or tokens + n > max_tokens):
+            batches.append(batch)
+            batch_tokens.append(tokens)
+            batch, tokens = [], 0
+        batch.append(chunk)
+        tokens += n
+    if batch:
+        batches.append(batch)
+        batch_tokens.append(tokens)
+    return batches, batch_tokens
 
 
-def estimate_cost(chunks):
-    """Estimate OpenAI API cost for embedding chunks."""
-    total_chars = sum(len(c.get("embedding_text", c.get("text", ""))) for c in chunks)
-    # Rough estimate: 4 chars per token
-    estimated_tokens = total_chars / 4
+def estimate_cost(token_counts):
+    """Estimate OpenAI API cost from {chunk_id: token count}."""
+    estimated_tokens = sum(token_counts.values())
     # text-embedding-3-small: $0.02 per 1M tokens
     estimated_cost = (estimated_tokens / 1_000_000) * 0.02
     return estimated_tokens, estimated_cost
 
 
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+class EmbeddingWriter:
+    """
+    Append embedded chunks to EMBEDDINGS_FILE and their vectors to
+    EMBEDDINGS_VECTORS_FILE.
+    
+    Vectors are written as raw rows of `dtype`, EMBEDDING_DIMENSIONS wide,
+    and each JSONL record carries the "vector_row" its vector landed in.
+    Chunks repeating already-embedded text share that row. Vectors are
+    flushed before the records that point at them, so an interrupted run
+    can leave an orphan row but never a dangling one.
+    
+    Full runs start both files fresh; append mode continues after the
+    rows already on disk (dropping a partial row left by a crash).
+    
+    Chunks are written as-is plus "vector_row" (set on the chunk dict
+    itself, not a copy) and are not kept afterwards; the writer only
+    tallies total_chunks and video_ids, and writes them to the meta
+    summary on exit (even if the run fails part-way). Append mode starts
+    from the totals in that summary.
+    """
+    
+    def __init__(self, append=False, dtype="float32"):
+        self.append = append
+        self.dtype = np.dtype(dtype)
+        self.row_bytes = EMBEDDING_DIMENSIONS * self.dtype.itemsize
+        self.next_row = 0
+        self.total_chunks = 0
+        self.video_ids = set()
+    
+    def __enter__(self):
+        if self.append:
+            self._load_totals()
+        mode = 'ab' if self.append else 'wb'
+        self._vectors = open(EMBEDDINGS_VECTORS_FILE, mode)
+        self._records = open(EMBEDDINGS_FILE, mode)
+        self.next_row = self._vectors.tell() // self.row_bytes
+        self._vectors.truncate(self.next_row * self.row_bytes)
+        return self
+    
+    def write(self, batch, embeddings):
+        """Append one batch; each chunk gets its "vector_row" set in place."""
+        vectors = np.asarray(embeddings, dtype=self.dtype)
+        if vectors.shape != (len(batch), EMBEDDING_DIMENSIONS):
+            raise ValueError(
+                f"Expected {len(batch)} vectors of {EMBEDDING_DIMENSIONS} dimensions, "
+                f"got shape {vectors.shape}. Check EMBEDDING_DIMENSIONS in config.py."
+            )
+        self._vectors.write(vectors.tobytes())
+        self._vectors.flush()
+        
+        rows = range(self.next_row, self.next_row + len(batch))
+        self.next_row += len(batch)
+        self._write_records(batch, rows)
+    
+    def write_duplicates(self, chunks, row):
+        """Append records for chunks whose text repeats the vector at `row`."""
+        self._write_records(chunks, [row] * len(chunks))
+    
+    def _write_records(self, chunks, rows):
+        for chunk, row in zip(chunks, rows):
+            chunk["vector_row"] = row
+            self.video_ids.add(chunk["video_id"])
+        self.total_chunks += len(chunks)
+        
+        self._records.write(b"".join(orjson.dumps(c) + b"\n" for c in chunks))
+        self._records.flush()
+    
+    def _load_totals(self):
+        """Start from the totals of the output already on disk."""
+        meta = load_meta()
+        if "video_ids" in meta:
+            self.total_chunks = meta["total_chunks"]
+            self.video_ids = set(meta["video_ids"])
+            return
+        # Summary from before video ids were kept: count the records instead
+        for record in iter_saved_embeddings():
+            self.total_chunks += 1
+            self.video_ids.add(record["video_id"])
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._vectors.close()
+        self._records.close()
+        save_meta(self.total_chunks, self.video_ids, self.dtype.name)
+        return False
+
+
+def export_parquet(vector_dtype):
+    """
+    Write every embedded chunk, vector included, to EMBEDDINGS_PARQUET_FILE.
+    
+    Streams EMBEDDINGS_FILE and the vector rows PARQUET_ROW_GROUP_SIZE
+    chunks at a time, so only one row group is in memory. Each row has
+    the chunk's fields, with "vector_row" replaced by "embedding": a
+    fixed-size list of float32 (float16 rows are widened for pandas/polars).
+    Compressed with zstd.
+    
+    Returns the number of rows written, or None if pyarrow is missing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.error("pyarrow not installed, skipping Parquet export")
+        logger.error("Run: pip install pyarrow")
+        return None
+    
+    vectors = np.memmap(EMBEDDINGS_VECTORS_FILE, dtype=vector_dtype, mode='r')
+    vectors = vectors.reshape(-1, EMBEDDING_DIMENSIONS)
+    
+    writer = None
+    record_schema = None  # Inferred from the first group, then held fixed
+    rows_written = 0
+    
+    def write_group(records):
+        nonlocal writer, record_schema, rows_written
+        # The vector replaces its row number
+        values = vectors[[r.pop("vector_row") for r in records]].astype(np.float32)
+        table = pa.Table.from_pylist(records, schema=record_schema)
+        record_schema = table.schema
+        table = table.append_column(
+            "embedding",
+            pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), EMBEDDING_DIMENSIONS)
+        )
+        if writer is None:
+            writer = pq.ParquetWriter(EMBEDDINGS_PARQUET_FILE, table.schema, compression="zstd")
+        writer.write_table(table)
+        rows_written += len(records)
+    
+    try:
+        group = []
+        for record in iter_saved_embeddings():
+            group.append(record)
+            if len(group) >= PARQUET_ROW_GROUP_SIZE:
+                write_group(group)
+                group = []
+        if group:
+            write_group(group)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_written
+
+
 # =============================================================================
 # MAIN PROCESSING
 # =============================================================================
 
-def process_embeddings(limit=None, incremental=False, batch_size=None):
+async def embed_chunks(client, chunks_to_process, token_counts, text_rows, progress, writer,
+                       batch_size, concurrency, batch_api=False,
+                       max_batch_tokens=MAX_TOKENS_PER_BATCH, rpm=REQUESTS_PER_MINUTE,
+                       tpm=TOKENS_PER_MINUTE):
+    """
+    Embed chunks in batches, keeping up to `concurrency` requests in flight.
+    
+    Batches are packed under both `batch_size` chunks and `max_batch_tokens`
+    tokens, and realtime requests are paced to `rpm` requests and `tpm`
+    tokens per minute.
+    Only the first chunk with a given embedding text is sent to the API;
+    repeats (in this run or an earlier incremental one) point at the same
+    vector row. Realtime batches run through embed_pipeline and are saved
+    as they finish; with batch_api they are submitted as Batch API jobs
+    instead. Each batch is handed to the EmbeddingWriter and checkpointed
+    in the ProgressLog straight away. Returns the run stats.
+    """
+    novel, copies, reused = split_duplicates(chunks_to_process, text_rows)
+    
+    batches, batch_tokens = pack_batches(novel, token_counts, batch_size, max_batch_tokens)
+    total_batches = len(batches)
+    stats = {"embedded": 0, "failed": 0, "tokens_used": 0, "deduplicated": 0}
+    
+    # Text embedded by an earlier run only needs a record pointing at its row
+    for chunk, row in reused:
+        writer.write_duplicates([chunk], row)
+        stats["embedded"] += 1
+        stats["deduplicated"] += 1
+    progress.embedded(chunk["chunk_id"] for chunk, _ in reused)
+    progress.flush()
+    if reused:
+        logger.info(f"Reused {len(reused)} vectors for text embedded in earlier runs")
+    
+    start_time = datetime.now()
+    done_chunks = 0
+    done_batches = 0
+    
+    def handle_result(batch_num, batch, tokens, embeddings):
+        nonlocal done_chunks, done_batches
+        done_chunks += len(batch)
+        done_batches += 1
+        
+        if isinstance(embeddings, BaseException):
+            logger.error(f"[Batch {batch_num}/{total_batches}] ✗ Error: {embeddings}")
+            failed = list(batch)
+            for chunk in batch:
+                failed.extend(copies.pop(text_key(chunk["embedding_text"])))
+            progress.failed(chunk["chunk_id"] for chunk in failed)
+            stats["failed"] += len(failed)
+        else:
+            # Save vectors and chunk records, then point repeats at the same rows
+            writer.write(batch, embeddings)
+            done = list(batch)
+            for chunk in batch:
+                key = text_key(chunk["embedding_text"])
+                text_rows[key] = chunk["vector_row"]
+                progress.text_row(key, chunk["vector_row"])
+                repeats = copies.pop(key)
+                if repeats:
+                    writer.write_duplicates(repeats, chunk["vector_row"])
+                    done.extend(repeats)
+                    stats["deduplicated"] += len(repeats)
+            progress.embedded(chunk["chunk_id"] for chunk in done)
+            stats["embedded"] += len(done)
+            
+            stats["tokens_used"] += tokens
+            
+            repeat_note = f" (+{len(done) - len(batch)} repeated)" if len(done) > len(batch) else ""
+            logger.info(f"[Batch {batch_num}/{total_batches}] ✓ Embedded {len(batch)} chunks{repeat_note}")
+        
+        progress.flush()
+        
+        # Report rate every 10 batches
+        if done_batches % 10 == 0:
+            elapsed = (datetime.now() - start_time).total_seconds()
+            rate = stats["embedded"] / elapsed * 3600 if elapsed > 0 else 0
+            remaining = len(novel) - done_chunks
+            eta_min = remaining / (rate / 60) if rate > 0 else 0
+            
+            logger.info(f"--- Rate: {rate:.0f}/hr, ETA: {eta_min:.1f}min ---")
+    
+    try:
+        if batch_api:
+            job_size = max(1, BATCH_API_MAX_INPUTS // batch_size)
+            for job_start in range(0, total_batches, job_size):
+                job_batches = batches[job_start:job_start + job_size]
+                job_tokens = batch_tokens[job_start:job_start + job_size]
+                results = await run_batch_job(job_batches, client, job_start + 1)
+                for batch_num, result in enumerate(zip(job_batches, job_tokens, results),
+                                                   start=job_start + 1):
+                    handle_result(batch_num, *result)
+        else:
+            # Retries are handled here (see embed_with_retry), not by the SDK as well
+            await embed_pipeline(
+                batches, batch_tokens, client.with_options(max_retries=0), concurrency,
+                RateLimitPause(), TokenBucket(rpm), TokenBucket(tpm), handle_result
+            )
+    finally:
+        await client.close()
+    
+    return stats
+
+
+def process_embeddings(limit=None, incremental=False, batch_size=None,
+                       concurrency=MAX_CONCURRENT_REQUESTS, fp16=False, batch_api=False,
+                       max_batch_tokens=MAX_TOKENS_PER_BATCH, rpm=REQUESTS_PER_MINUTE,
+                       tpm=TOKENS_PER_MINUTE,
+                       truncate_oversized=True, parquet=False):
     """Generate embeddings for all chunks."""
     
     # Use default batch size from config if not specified
     if batch_size is None:
         batch_size = EMBEDDING_BATCH_SIZE
+    concurrency = max(1, concurrency)
+    vector_dtype = "float16" if fp16 else "float32"
     
     logger.info("=" * 60)
     logger.info("Starting Embedding Generation")
@@ -285,6 +1189,13 @@ def process_embeddings(limit=None, incremental=False, batch_size=None):
     logger.info(f"  Model: {EMBEDDING_MODEL}")
     logger.info(f"  Dimensions: {EMBEDDING_DIMENSIONS}")
     logger.info(f"  Batch size: {batch_size}")
+    logger.info(f"  Max tokens per batch: {max_batch_tokens:,}")
+    logger.info(f"  Concurrency: {concurrency}")
+    logger.info(f"  RPM limit: {f'{rpm:,}' if rpm else 'off'}")
+    logger.info(f"  TPM limit: {f'{tpm:,}' if tpm else 'off'}")
+    logger.info(f"  Vector storage: {vector_dtype}")
+    if batch_api:
+        logger.info(f"  Mode: Batch API (50% cost, results within 24h)")
     
     # Validate API key
     if not OPENAI_API_KEY:
@@ -295,148 +1206,108 @@ def process_embeddings(limit=None, incremental=False, batch_size=None):
     
     # Import OpenAI here to avoid import error if not installed
     try:
-        from openai import OpenAI
+        import openai
     except ImportError:
         logger.error("OpenAI package not installed!")
         logger.error("Run: pip install openai")
         return
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    logger.info("OpenAI client initialized")
-    
     # Load chunks
     if not CHUNKS_FILE.exists():
         logger.error(f"Chunks file not found: {CHUNKS_FILE}")
         logger.error("Run 04_chunk_transcripts_v2.py first")
         return
     
-    with open(CHUNKS_FILE, 'r') as f:
-        chunks_data = json.load(f)
-    
-    all_chunks = chunks_data.get("chunks", [])
-    logger.info(f"Loaded {len(all_chunks)} chunks from {CHUNKS_FILE}")
-    
-    # Load progress
-    progress = load_progress()
-    
     # Filter chunks to process
+    already_embedded, text_rows = set(), {}
     if incremental:
-        already_embedded = set(progress.get("embedded_chunk_ids", []))
-        chunks_to_process = [c for c in all_chunks if c["chunk_id"] not in already_embedded]
+        already_embedded, text_rows = load_progress(vector_dtype)
         logger.info(f"Incremental mode: {len(already_embedded)} already embedded")
-    else:
-        chunks_to_process = all_chunks
-        progress = {"embedded_chunk_ids": [], "failed_chunk_ids": []}
     
-    # Apply limit
     if limit:
-        chunks_to_process = chunks_to_process[:limit]
         logger.info(f"Limit mode: processing first {limit} chunks")
     
+    # Stream chunks, keeping only those still to be embedded
+    chunks_to_process = []
+    chunk_count = 0
+    for chunk in iter_chunks():
+        chunk_count += 1
+        if chunk["chunk_id"] in already_embedded:
+            continue
+        if "embedding_text" not in chunk:
+            logger.error(f"Chunk {chunk['chunk_id']} has no embedding_text")
+            logger.error("Re-run 04_chunk_transcripts_v2.py to rebuild all_chunks.json")
+            return
+        chunks_to_process.append(chunk)
+        if limit and len(chunks_to_process) >= limit:
+            break
+    logger.info(f"Read {chunk_count} chunks from {CHUNKS_FILE}")
+    
     logger.info(f"Chunks to embed: {len(chunks_to_process)}")
     
     if not chunks_to_process:
         logger.info("No chunks to embed!")
         return
     
+    # Count tokens once: used for the cost estimate, batch packing and TPM pacing
+    token_counts = count_tokens(chunks_to_process)
+    
+    # Inputs over the API's per-input limit would fail their whole batch
+    chunks_to_process, oversized = cap_oversized(chunks_to_process, token_counts, truncate_oversized)
+    if oversized:
+        logger.warning(f"Left out {len(oversized)} oversized chunks (see --no-truncate-oversized)")
+        # Even if nothing else is left, carry on: the main block records them
+        # as failed and keeps the progress files in step with the outputs
+    
     # Estimate cost
-    est_tokens, est_cost = estimate_cost(chunks_to_process)
-    logger.info(f"Estimated tokens: {est_tokens:,.0f}")
+    est_tokens, est_cost = estimate_cost(token_counts)
+    if batch_api:
+        est_cost *= BATCH_API_DISCOUNT
+    logger.info(f"Tokens to embed: {est_tokens:,}")
     logger.info(f"Estimated cost: ${est_cost:.4f}")
     
-    # Load existing embeddings if incremental
-    embedded_chunks = []
-    if incremental and EMBEDDINGS_FILE.exists():
-        with open(EMBEDDINGS_FILE, 'r') as f:
-            existing_data = json.load(f)
-            embedded_chunks = existing_data.get("chunks", [])
-        logger.info(f"Loaded {len(embedded_chunks)} existing embeddings")
+    # Appended vectors must match the dtype of the rows already on disk
+    if incremental and EMBEDDINGS_META_FILE.exists():
+        saved_dtype = load_meta().get("vector_dtype", "float32")
+        if saved_dtype != vector_dtype:
+            logger.error(f"Existing vectors are stored as {saved_dtype}, not {vector_dtype}")
+            logger.error("Re-run with the same --fp16 setting, or without --incremental to rebuild")
+            return
     
-    # Process in batches
-    total_batches = (len(chunks_to_process) + batch_size - 1) // batch_size
-    stats = {"embedded": 0, "failed": 0, "tokens_used": 0}
+    # Initialize OpenAI client only now that there is work for it;
+    # embed_chunks closes it when done
+    try:
+        client = get_openai_client(concurrency)
+    except ImportError:
+        logger.error("HTTP/2 support not installed!")
+        logger.error("Run: pip install 'httpx[http2]'")
+        return
+    logger.info("OpenAI client initialized (HTTP/2)")
     
+    # Process in batches, several requests in flight at once
+    # Incremental runs append to the existing files; full runs start them fresh
     start_time = datetime.now()
+    with ProgressLog(append=incremental) as progress, \
+            EmbeddingWriter(append=incremental, dtype=vector_dtype) as writer:
+        if incremental:
+            logger.info(f"Found {writer.total_chunks} existing embeddings")
+        progress.failed(c["chunk_id"] for c in oversized)
+        stats = asyncio.run(
+            embed_chunks(client, chunks_to_process, token_counts, text_rows, progress, writer,
+                         batch_size, concurrency, batch_api, max_batch_tokens, rpm, tpm)
+        )
     
-    for batch_idx in range(0, len(chunks_to_process), batch_size):
-        batch = chunks_to_process[batch_idx:batch_idx + batch_size]
-        batch_num = batch_idx // batch_size + 1
-        
-        try:
-            # Prepare texts for embedding
-            texts = [c.get("embedding_text", c.get("text", "")) for c in batch]
-            
-            # Generate embeddings
-            embeddings = generate_embeddings_batch(texts, client)
-            
-            # Add embeddings to chunks
-            for chunk, embedding in zip(batch, embeddings):
-                chunk_with_embedding = chunk.copy()
-                chunk_with_embedding["embedding"] = embedding
-                embedded_chunks.append(chunk_with_embedding)
-                progress["embedded_chunk_ids"].append(chunk["chunk_id"])
-                stats["embedded"] += 1
-            
-            # Estimate tokens used
-            batch_chars = sum(len(t) for t in texts)
-            stats["tokens_used"] += batch_chars // 4
-            
-            logger.info(f"[Batch {batch_num}/{total_batches}] ✓ Embedded {len(batch)} chunks")
-            
-            # Rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
-            
-        except Exception as e:
-            logger.error(f"[Batch {batch_num}/{total_batches}] ✗ Error: {e}")
-            for chunk in batch:
-                progress["failed_chunk_ids"].append(chunk["chunk_id"])
-                stats["failed"] += 1
-        
-        # Save progress every 10 batches
-        if batch_num % 10 == 0:
-            save_progress(progress)
-            
-            # Save intermediate embeddings
-            output_data = {
-                "created_at": datetime.now().isoformat(),
-                "channel_handle": CHANNEL_HANDLE,
-                "channel_display_name": CHANNEL_DISPLAY_NAME,
-                "model": EMBEDDING_MODEL,
-                "dimensions": EMBEDDING_DIMENSIONS,
-                "total_chunks": len(embedded_chunks),
-                "chunks": embedded_chunks
-            }
-            with open(EMBEDDINGS_FILE, 'w') as f:
-                json.dump(output_data, f)
-            
-            elapsed = (datetime.now() - start_time).total_seconds()
-            rate = stats["embedded"] / elapsed * 3600 if elapsed > 0 else 0
-            remaining = len(chunks_to_process) - batch_idx - len(batch)
-            eta_min = remaining / (rate / 60) if rate > 0 else 0
-            
-            logger.info(f"--- Progress saved. Rate: {rate:.0f}/hr, ETA: {eta_min:.1f}min ---")
-    
-    # Final save
-    save_progress(progress)
-    
-    output_data = {
-        "created_at": datetime.now().isoformat(),
-        "channel_handle": CHANNEL_HANDLE,
-        "channel_display_name": CHANNEL_DISPLAY_NAME,
-        "model": EMBEDDING_MODEL,
-        "dimensions": EMBEDDING_DIMENSIONS,
-        "total_chunks": len(embedded_chunks),
-        "total_videos": len(set(c["video_id"] for c in embedded_chunks)),
-        "chunks": embedded_chunks
-    }
-    
-    with open(EMBEDDINGS_FILE, 'w') as f:
-        json.dump(output_data, f)
+    # Optional columnar copy of the full output
+    parquet_rows = None
+    if parquet:
+        logger.info(f"Exporting {writer.total_chunks} embeddings to Parquet...")
+        parquet_rows = export_parquet(vector_dtype)
     
     # Summary
     elapsed = (datetime.now() - start_time).total_seconds()
     actual_cost = (stats["tokens_used"] / 1_000_000) * 0.02
+    if batch_api:
+        actual_cost *= BATCH_API_DISCOUNT
     
     logger.info("")
     logger.info("=" * 60)
@@ -445,10 +1316,16 @@ def process_embeddings(limit=None, incremental=False, batch_size=None):
     logger.info(f"Time elapsed: {elapsed/60:.2f} minutes")
     logger.info(f"Chunks embedded: {stats['embedded']}")
     logger.info(f"Failed: {stats['failed']}")
-    logger.info(f"Estimated tokens used: {stats['tokens_used']:,}")
-    logger.info(f"Estimated cost: ${actual_cost:.4f}")
-    logger.info(f"Total embeddings in output: {len(embedded_chunks)}")
+    dedup_rate = stats["deduplicated"] / stats["embedded"] * 100 if stats["embedded"] else 0
+    logger.info(f"Repeated texts reused: {stats['deduplicated']} ({dedup_rate:.1f}%)")
+    logger.info(f"Tokens used: {stats['tokens_used']:,}")
+    logger.info(f"Estimated cost: ${actual_cost:.4f}{' (Batch API, 50% off)' if batch_api else ''}")
+    logger.info(f"Total embeddings in output: {writer.total_chunks}")
     logger.info(f"Output file: {EMBEDDINGS_FILE}")
+    logger.info(f"Vectors file: {EMBEDDINGS_VECTORS_FILE}")
+    logger.info(f"Summary file: {EMBEDDINGS_META_FILE}")
+    if parquet_rows is not None:
+        logger.info(f"Parquet file: {EMBEDDINGS_PARQUET_FILE} ({parquet_rows} rows)")
 
 
 # =============================================================================
@@ -466,6 +1343,11 @@ Examples:
     python 05_generate_embeddings_v2.py --limit 100      # Process first 100 chunks
     python 05_generate_embeddings_v2.py --incremental    # Only embed new chunks
     python 05_generate_embeddings_v2.py --batch-size 50  # Custom batch size
+    python 05_generate_embeddings_v2.py --concurrency 2  # Fewer requests in flight
+    python 05_generate_embeddings_v2.py --rpm 500 --tpm 40000  # Lower-tier limits
+    python 05_generate_embeddings_v2.py --fp16           # Store vectors as float16
+    python 05_generate_embeddings_v2.py --batch-api      # Half-price bulk run via Batch API
+    python 05_generate_embeddings_v2.py --parquet        # Also export to Parquet
         """
     )
     
@@ -488,6 +1370,59 @@ Examples:
         help=f'Number of chunks per API call (default: {EMBEDDING_BATCH_SIZE})'
     )
     
+    parser.add_argument(
+        '--max-tokens-per-batch',
+        type=int,
+        default=MAX_TOKENS_PER_BATCH,
+        help=f'Token cap per API call (default: {MAX_TOKENS_PER_BATCH:,})'
+    )
+    
+    parser.add_argument(
+        '--rpm',
+        type=int,
+        default=REQUESTS_PER_MINUTE,
+        help=f'Requests per minute to stay under, 0 to disable (default: {REQUESTS_PER_MINUTE:,})'
+    )
+    
+    parser.add_argument(
+        '--tpm',
+        type=int,
+        default=TOKENS_PER_MINUTE,
+        help=f'Tokens per minute to stay under, 0 to disable (default: {TOKENS_PER_MINUTE:,})'
+    )
+    
+    parser.add_argument(
+        '--no-truncate-oversized',
+        dest='truncate_oversized',
+        action='store_false',
+        help=f'Leave out chunks over {MAX_INPUT_TOKENS:,} tokens instead of truncating them'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=f'Maximum API requests in flight at once (default: {MAX_CONCURRENT_REQUESTS})'
+    )
+    
+    parser.add_argument(
+        '--fp16',
+        action='store_true',
+        help='Store vectors as float16 instead of float32 (half the size)'
+    )
+    
+    parser.add_argument(
+        '--batch-api',
+        action='store_true',
+        help='Submit through the OpenAI Batch API (50%% cost, completes within 24h)'
+    )
+    
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Also export all embeddings to a Parquet file (requires pyarrow)'
+    )
+    
     return parser.parse_args()
 
 
@@ -500,5 +1435,13 @@ if __name__ == "__main__":
     process_embeddings(
         limit=args.limit,
         incremental=args.incremental,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        fp16=args.fp16,
+        batch_api=args.batch_api,
+        max_batch_tokens=args.max_tokens_per_batch,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        truncate_oversized=args.truncate_oversized,
+        parquet=args.parquet
     )
@@ -22,21 +22,47 @@ HOW IT WORKS
 ================================================================================
 
 1. LOAD EMBEDDINGS
-   - Reads youtube_embeddings.json from Step 05
-   - Each chunk has a 1536-dimension embedding vector + metadata
+   - Streams youtube_embeddings.jsonl from Step 05 (one chunk per line),
+     so the first batch uploads while the rest of the file is still
+     being read and only a few batches are ever held in memory
+   - Memory-maps youtube_embeddings.vectors.bin, which holds each
+     chunk's 1536-dimension vector at row "vector_row"
 
 2. PREPARE VECTORS
    - Formats each chunk for Pinecone's expected structure
    - Truncates metadata to stay within Pinecone's 40KB limit
    - Adds content_type field for filtering
+   - Adds a content_hash of what the vector was made from (chunk id,
+     embedding text, model and metadata), so unchanged chunks can be
+     recognized on later runs even after they are re-embedded
 
 3. BATCH UPLOAD
-   - Groups vectors into batches (default: 100 per batch)
-   - Upserts to Pinecone (insert or update if ID exists)
+   - Packs vectors into batches as large as Pinecone allows: at most
+     1000 vectors (PINECONE_BATCH_SIZE) and about 1.8MB of request body
+     (the API limit is 2MB), estimated from each vector's size
+   - Upserts to Pinecone (insert or update if ID exists), keeping 30
+     batches in flight: as soon as any one finishes the next is sent,
+     so a slow batch never holds up the others
+   - A background thread prepares the next few batches while earlier
+     ones are uploading; on multi-core machines it spreads the work
+     (vector lookup, metadata, content hash) over up to 4 processes
+   - Uses Pinecone's gRPC client when installed (pinecone[grpc]): one
+     persistent HTTP/2 channel carries every upsert, and vectors travel
+     as binary floats rather than JSON text, so batches hold ~5x more
+   - Over REST, float16 vectors (Step 05 --fp16) are sent with the 5
+     significant digits float16 holds rather than their full binary
+     expansion, roughly halving the JSON per vector
+   - With --skip-unchanged, fetches each batch's ids first and leaves
+     out vectors whose stored content_hash matches, so only new or
+     changed chunks are written (each fetch downloads the stored
+     vectors, so this trades read traffic for fewer writes)
+   - Rate limits, 5xx errors and dropped connections are retried with
+     randomized exponential backoff; bad requests fail straight away
    - Uses namespace to separate from other content
 
 4. VERIFY
-   - Reports final vector count in index
+   - Reports vector counts in the index before and after (--show-stats;
+     off by default to save two round trips)
    - Optional test search to verify functionality
 
 ================================================================================
@@ -59,24 +85,19 @@ Metadata fields:
 - video_title, channel, thumbnail_url: Display info
 - youtube_url: Direct link with timestamp
 - content_type: "youtube_transcript" (for filtering)
+- content_hash: Hash of the chunk's inputs (for --skip-unchanged)
 
 ================================================================================
 INPUT FORMAT (from Script 05)
 ================================================================================
 
-data/embeddings/youtube_embeddings.json:
-{
-    "chunks": [
-        {
-            "chunk_id": "yt-abc123-0000",
-            "embedding": [0.0123, -0.0456, ...],  // 1536 floats
-            "video_id": "abc123",
-            "text": "...",
-            "video_title": "...",
-            ...
-        }
-    ]
-}
+data/embeddings/youtube_embeddings.jsonl (one chunk per line):
+{"chunk_id": "yt-abc123-0000", "vector_row": 0, "video_id": "abc123", "text": "...", "video_title": "...", ...}
+{"chunk_id": "yt-abc123-0001", "vector_row": 1, "video_id": "abc123", "text": "...", "video_title": "...", ...}
+
+data/embeddings/youtube_embeddings.vectors.bin:
+    Raw rows of 1536 values; dtype ("float32" or "float16") and
+    dimensions come from youtube_embeddings.meta.json
 
 ================================================================================
 USAGE
@@ -88,6 +109,12 @@ Basic upload (all embeddings):
 Limit upload (for testing):
     python 06_upload_to_pinecone_v2.py --limit 100
 
+Show index vector counts before and after the upload:
+    python 06_upload_to_pinecone_v2.py --show-stats
+
+Only upsert chunks that are new or changed since the last upload:
+    python 06_upload_to_pinecone_v2.py --skip-unchanged
+
 Dry run (preview without uploading):
     python 06_upload_to_pinecone_v2.py --dry-run
 
@@ -97,6 +124,7 @@ Delete all vectors in namespace (careful!):
 Test search after upload:
     python 06_upload_to_pinecone_v2.py --test
     python 06_upload_to_pinecone_v2.py --test --query "your search query"
+    python 06_upload_to_pinecone_v2.py --test --query "first" --query "second"
 
 ================================================================================
 REQUIREMENTS
@@ -105,12 +133,15 @@ REQUIREMENTS
 Prerequisites:
     - Python 3.8+
     - config.py in project root (created by yt_ai_search_setup.sh)
-    - Completed Step 05 (youtube_embeddings.json exists)
+    - Completed Step 05 (youtube_embeddings.jsonl exists)
     - Pinecone API key in .env file
     - Pinecone index already created
 
 Dependencies:
-    - pinecone-client>=3.0.0
+    - pinecone-client>=3.0.0 (pinecone[grpc] for the faster gRPC upload path)
+    - numpy
+    - orjson>=3.9.0
+    - openai, httpx[http2] (for --test only)
 
 Pinecone Setup:
     1. Create account at https://app.pinecone.io
@@ -153,18 +184,30 @@ PINECONE SETTINGS (from config.py)
 
 PINECONE_INDEX = "mohler-ai"      # Your index name
 PINECONE_NAMESPACE = "youtube"    # Namespace for YouTube content
-PINECONE_BATCH_SIZE = 100         # Vectors per upsert call
+PINECONE_BATCH_SIZE = 1000        # Max vectors per upsert call
 
 ================================================================================
 """
 
 import argparse
-import json
+import collections
+import functools
+import hashlib
+import itertools
 import logging
+import os
+import queue
+import random
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+import orjson
+
 # =============================================================================
 # PATH SETUP
 # =============================================================================
@@ -186,6 +229,8 @@ from config import (
     PINECONE_NAMESPACE,
     PINECONE_BATCH_SIZE,
     EMBEDDINGS_FILE,
+    EMBEDDINGS_META_FILE,
+    EMBEDDINGS_VECTORS_FILE,
     LOGS_DIR,
     EMBEDDING_MODEL,
     ensure_directories,
@@ -211,12 +256,51 @@ def setup_logging():
 
 logger = setup_logging()
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MAX_INFLIGHT_UPSERTS = 30  # Upsert batches in flight at once
+MAX_UPSERT_ATTEMPTS = 3    # Tries per batch before it is counted as failed
+UPSERT_BACKOFF_SECONDS = 1 # Base delay, doubled on each retry
+PREPARED_BATCHES_AHEAD = 4 # Prepared batches queued ahead of the uploads
+PREPARE_GROUP_SIZE = 256   # Chunks whose vectors are looked up together
+# Processes preparing vectors; one core is left for the uploads (0 = prepare in-thread)
+PREPARE_PROCESSES = min((os.cpu_count() or 1) - 1, 4)
+PREPARE_GROUPS_AHEAD = 8   # Groups being prepared across those processes at once
+MAX_CONCURRENT_QUERIES = 8 # Test search queries sent to Pinecone at once
+FETCH_BATCH_SIZE = 200     # Ids per fetch when checking for unchanged vectors
+HTTP_TIMEOUT_SECONDS = 30  # OpenAI request timeout for test search queries
+HTTP_CONNECT_TIMEOUT = 10  # Connection timeout for the same
+
+# Pinecone rejects upsert requests over 2MB; stay under with some margin
+MAX_UPSERT_BYTES = int(1.8 * 1024 * 1024)
+JSON_BYTES_PER_VALUE = 23  # A float32 value as JSON text (~22 bytes with separator)
+JSON_FP16_BYTES_PER_VALUE = 12  # A float16 value as JSON text, once shortened (~11 bytes)
+FP16_SIGNIFICANT_DIGITS = 5     # Enough to tell every float16 value apart
+GRPC_BYTES_PER_VALUE = 4   # A float32 value in a gRPC (protobuf) request
+VECTOR_OVERHEAD_BYTES = 64 # Keys, brackets and the id around each vector
+
 # =============================================================================
 # PINECONE HELPERS
 # =============================================================================
 
-def get_pinecone_index():
-    """Initialize Pinecone and return index."""
+def grpc_available():
+    """True if the gRPC flavor of the Pinecone client (pinecone[grpc]) is installed."""
+    try:
+        from pinecone.grpc import PineconeGRPC
+    except ImportError:
+        return False
+    return True
+
+
+def get_pinecone_index(use_grpc=False):
+    """
+    Initialize Pinecone and return index.
+    
+    With use_grpc the index talks gRPC over one persistent HTTP/2
+    channel, which many concurrent upserts share; otherwise REST.
+    """
     if not PINECONE_API_KEY:
         raise ValueError(
             "PINECONE_API_KEY not found!\n"
@@ -233,19 +317,56 @@ def get_pinecone_index():
             "Run: pip install pinecone-client"
         )
     
-    pc = Pinecone(api_key=PINECONE_API_KEY)
+    if use_grpc:
+        from pinecone.grpc import PineconeGRPC
+        pc = PineconeGRPC(api_key=PINECONE_API_KEY)
+    else:
+        pc = Pinecone(api_key=PINECONE_API_KEY)
     index = pc.Index(PINECONE_INDEX)
     
     return index
 
 
-def prepare_vector(chunk):
+def iter_embeddings():
+    """Yield embedded chunks from Step 05's JSONL output, one line at a time."""
+    with open(EMBEDDINGS_FILE, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_meta():
+    """Read the run summary Step 05 writes next to its JSONL output."""
+    with open(EMBEDDINGS_META_FILE, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def load_vectors():
+    """
+    Memory-map the vector rows written by Step 05.
+    
+    Rows are only read from disk as they are indexed, so the whole
+    matrix never has to fit in memory.
+    """
+    meta = load_meta()
+    dimensions = meta["dimensions"]
+    dtype = meta.get("vector_dtype", "float32")
+    
+    if EMBEDDINGS_VECTORS_FILE.stat().st_size == 0:
+        return np.empty((0, dimensions), dtype=dtype)
+    return np.memmap(EMBEDDINGS_VECTORS_FILE, dtype=dtype, mode='r').reshape(-1, dimensions)
+
+
+def prepare_vector(chunk, values):
     """
     Prepare a chunk for Pinecone upload.
     
     Pinecone metadata has size limits:
     - Total metadata size: 40KB per vector
     - Individual string values: should be under 10KB
+    
+    `values` is the chunk's embedding as a plain list of floats (see
+    vector_values).
     """
     
     # Truncate text for metadata (keep under 1000 chars for safety)
@@ -253,45 +374,304 @@ def prepare_vector(chunk):
     if len(chunk.get("text", "")) > 1000:
         text_preview += "..."
     
+    metadata = {
+        # Core identifiers
+        "video_id": chunk["video_id"],
+        "chunk_index": chunk["chunk_index"],
+        
+        # Text content (truncated for metadata limits)
+        "text": text_preview,
+        
+        # Timestamps for deep linking
+        "start_time": chunk["start_time"],
+        "end_time": chunk["end_time"],
+        "start_timestamp": chunk["start_timestamp"],
+        "end_timestamp": chunk["end_timestamp"],
+        "duration_seconds": chunk["duration_seconds"],
+        
+        # Video metadata
+        "video_title": chunk.get("video_title", "")[:200],
+        "channel": chunk.get("channel", CHANNEL_DISPLAY_NAME),
+        "video_duration_seconds": chunk.get("video_duration_seconds", 0),
+        "thumbnail_url": chunk.get("thumbnail_url", ""),
+        
+        # Links
+        "youtube_url": chunk["youtube_url"],
+        "video_url": chunk["video_url"],
+        
+        # For filtering
+        "content_type": "youtube_transcript"
+    }
+    metadata["content_hash"] = content_hash(chunk, metadata)
+    
     return {
         "id": chunk["chunk_id"],
-        "values": chunk["embedding"],
-        "metadata": {
-            # Core identifiers
-            "video_id": chunk["video_id"],
-            "chunk_index": chunk["chunk_index"],
-            
-            # Text content (truncated for metadata limits)
-            "text": text_preview,
-            
-            # Timestamps for deep linking
-            "start_time": chunk["start_time"],
-            "end_time": chunk["end_time"],
-            "start_timestamp": chunk["start_timestamp"],
-            "end_timestamp": chunk["end_timestamp"],
-            "duration_seconds": chunk["duration_seconds"],
-            
-            # Video metadata
-            "video_title": chunk.get("video_title", "")[:200],
-            "channel": chunk.get("channel", CHANNEL_DISPLAY_NAME),
-            "video_duration_seconds": chunk.get("video_duration_seconds", 0),
-            "thumbnail_url": chunk.get("thumbnail_url", ""),
-            
-            # Links
-            "youtube_url": chunk["youtube_url"],
-            "video_url": chunk["video_url"],
-            
-            # For filtering
-            "content_type": "youtube_transcript"
-        }
+        "values": values,
+        "metadata": metadata
     }
 
 
+def content_hash(chunk, metadata):
+    """
+    Short, stable hash of what a chunk's vector is made from.
+    
+    Hashes the inputs (chunk id, embedding text, model, metadata) rather
+    than the floats: re-embedding the same text doesn't return
+    bit-identical vectors, so a hash of the values would always change.
+    """
+    inputs = [
+        chunk["chunk_id"],
+        chunk.get("embedding_text", chunk.get("text", "")),
+        EMBEDDING_MODEL,
+        metadata,
+    ]
+    return hashlib.blake2b(orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+
+
+GRPC_RETRYABLE_CODES = ("UNAVAILABLE", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED", "INTERNAL")
+
+
+def is_retryable(error):
+    """True for rate limits, 5xx responses and dropped connections; False for bad requests."""
+    code = getattr(error, "code", None)
+    if callable(code):
+        # grpc.RpcError from the gRPC client
+        return getattr(code(), "name", None) in GRPC_RETRYABLE_CODES
+    status = getattr(error, "status", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # urllib3 carries the Pinecone client's HTTP traffic
+    try:
+        from urllib3.exceptions import HTTPError as TransportError
+    except ImportError:
+        TransportError = ConnectionError
+    return isinstance(error, (ConnectionError, TimeoutError, TransportError))
+
+
+def upsert_with_retry(index, batch_vectors):
+    """
+    Upsert prepared vectors, retrying transient failures.
+    
+    Up to MAX_UPSERT_ATTEMPTS tries, sleeping UPSERT_BACKOFF_SECONDS
+    doubled per attempt plus jitter. Errors that is_retryable rejects
+    (schema, auth, payload size) are raised on the first try.
+    """
+    for attempt in range(1, MAX_UPSERT_ATTEMPTS + 1):
+        try:
+            return index.upsert(vectors=batch_vectors, namespace=PINECONE_NAMESPACE)
+        except Exception as e:
+            if attempt == MAX_UPSERT_ATTEMPTS or not is_retryable(e):
+                raise
+            delay = UPSERT_BACKOFF_SECONDS * 2 ** (attempt - 1) + random.uniform(0, 1)
+            logger.warning(
+                f"Upsert failed ({type(e).__name__}: {e}); "
+                f"retrying in {delay:.1f}s (attempt {attempt}/{MAX_UPSERT_ATTEMPTS})"
+            )
+            time.sleep(delay)
+
+
+def fetch_content_hashes(index, ids):
+    """Map each of `ids` already in the namespace to its stored content_hash."""
+    hashes = {}
+    for start in range(0, len(ids), FETCH_BATCH_SIZE):
+        response = index.fetch(ids=ids[start:start + FETCH_BATCH_SIZE], namespace=PINECONE_NAMESPACE)
+        for vector_id, vector in response.vectors.items():
+            hashes[vector_id] = (vector.metadata or {}).get("content_hash")
+    return hashes
+
+
+def upload_batch(index, batch_vectors, skip_unchanged=False):
+    """
+    Upsert a prepared batch, returning how many vectors were skipped.
+    
+    With skip_unchanged, vectors whose content_hash already matches the
+    stored one are left out. If that check fails the whole batch is
+    upserted, which is always safe.
+    """
+    if skip_unchanged:
+        try:
+            stored = fetch_content_hashes(index, [v["id"] for v in batch_vectors])
+        except Exception as e:
+            logger.warning(f"Could not check for unchanged vectors ({e}); upserting the whole batch")
+            stored = {}
+        changed = [v for v in batch_vectors if stored.get(v["id"]) != v["metadata"]["content_hash"]]
+    else:
+        changed = batch_vectors
+    
+    if changed:
+        upsert_with_retry(index, changed)
+    return len(batch_vectors) - len(changed)
+
+
+def vector_values(chunks, vectors):
+    """
+    Look up the embeddings of several chunks in `vectors` (from
+    load_vectors) as lists of floats.
+    
+    All the rows are gathered with one fancy index and converted with a
+    single .tolist(), rather than a memmap lookup and conversion per chunk.
+    float16 rows are rounded to FP16_SIGNIFICANT_DIGITS first: the same
+    float16 values, but with short decimal forms in a JSON request.
+    """
+    rows = vectors[[chunk["vector_row"] for chunk in chunks]]
+    if rows.dtype == np.float16:
+        rows = round_significant(rows.astype(np.float64), FP16_SIGNIFICANT_DIGITS)
+    return rows.tolist()
+
+
+def round_significant(values, digits):
+    """Round each of `values` (a float64 array) to `digits` significant digits."""
+    magnitude = np.floor(np.log10(np.abs(np.where(values == 0, 1, values))))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.round(values * scale) / scale
+
+
+def estimated_vector_bytes(vector, bytes_per_value):
+    """Rough size of one prepared vector in an upsert request body."""
+    return (
+        len(vector["values"]) * bytes_per_value
+        + len(orjson.dumps(vector["metadata"]))
+        + len(vector["id"])
+        + VECTOR_OVERHEAD_BYTES
+    )
+
+
+# Set in each prepare worker process by init_prepare_worker
+worker_vectors = None
+
+
+def init_prepare_worker():
+    """Memory-map the vector rows once in each prepare worker process."""
+    global worker_vectors
+    worker_vectors = load_vectors()
+
+
+def prepare_group(chunks, vectors=None):
+    """
+    Prepare a group of chunks, looking their vectors up together.
+    
+    Returns one entry per chunk: its prepared vector, or a RuntimeError
+    if it couldn't be prepared. Without `vectors`, uses the worker
+    process's own memory map (see init_prepare_worker).
+    """
+    if vectors is None:
+        vectors = worker_vectors
+    try:
+        group_values = vector_values(chunks, vectors)
+    except Exception:
+        # Look the chunks up one by one so only the bad one fails
+        group_values = []
+        for chunk in chunks:
+            try:
+                group_values.append(vector_values([chunk], vectors)[0])
+            except Exception as e:
+                group_values.append(RuntimeError(f"No vector for {chunk.get('chunk_id')}: {e}"))
+    
+    results = []
+    for chunk, values in zip(chunks, group_values):
+        if isinstance(values, Exception):
+            results.append(values)
+            continue
+        try:
+            results.append(prepare_vector(chunk, values))
+        except Exception as e:
+            results.append(RuntimeError(f"Could not prepare {chunk.get('chunk_id')}: {e}"))
+    return results
+
+
+def prepare_batches(chunks, vectors, prepared, bytes_per_value, pool=None):
+    """
+    Producer for the upload loop: prepare each chunk (from any iterable,
+    typically iter_embeddings streaming the file) and pack the results
+    into batches of at most PINECONE_BATCH_SIZE vectors and
+    MAX_UPSERT_BYTES estimated bytes, counting `bytes_per_value` per
+    float (it depends on the transport). Chunks are read
+    PREPARE_GROUP_SIZE at a time so their vectors can be looked up together.
+    
+    With a process `pool`, the groups are prepared across its workers,
+    at most PREPARE_GROUPS_AHEAD at once, and packed in file order.
+    
+    Puts (batch_num, batch_size, vectors) on the `prepared` queue for each
+    batch, then None when done. A chunk that can't be prepared is put as
+    (None, 1, exception). If reading or preparing stops altogether (a
+    truncated JSONL line, a broken worker pool), the exception itself is
+    put in place of the final None. The queue is bounded, so this stays
+    only PREPARED_BATCHES_AHEAD batches ahead of the uploads.
+    """
+    batch_num = 0
+    batch, batch_bytes = [], 0
+    
+    def flush():
+        nonlocal batch_num, batch, batch_bytes
+        batch_num += 1
+        prepared.put((batch_num, len(batch), batch))
+        batch, batch_bytes = [], 0
+    
+    def add(vector):
+        nonlocal batch_bytes
+        size = estimated_vector_bytes(vector, bytes_per_value)
+        if batch and (len(batch) >= PINECONE_BATCH_SIZE or batch_bytes + size > MAX_UPSERT_BYTES):
+            flush()
+        batch.append(vector)
+        batch_bytes += size
+    
+    def groups():
+        chunk_iter = iter(chunks)
+        while True:
+            group = list(itertools.islice(chunk_iter, PREPARE_GROUP_SIZE))
+            if not group:
+                return
+            yield group
+    
+    def prepared_groups():
+        if pool is None:
+            for group in groups():
+                yield prepare_group(group, vectors)
+            return
+        pending = collections.deque()
+        try:
+            for group in groups():
+                pending.append(pool.submit(prepare_group, group))
+                if len(pending) >= PREPARE_GROUPS_AHEAD:
+                    yield pending.popleft().result()
+        except Exception:
+            # Still upload the groups read before the file went bad
+            while pending:
+                yield pending.popleft().result()
+            raise
+        while pending:
+            yield pending.popleft().result()
+    
+    error = None
+    try:
+        for results in prepared_groups():
+            for result in results:
+                if isinstance(result, Exception):
+                    prepared.put((None, 1, result))
+                else:
+                    add(result)
+    except Exception as e:
+        error = e
+    finally:
+        # Whatever was prepared before a failure still goes up
+        if batch:
+            flush()
+        prepared.put(error)
+
+
 # =============================================================================
 # MAIN FUNCTIONS
 # =============================================================================
 
-def upload_to_pinecone(limit=None, dry_run=False):
+def log_index_stats(stats, label):
+    """Log the index-wide and namespace vector counts from describe_index_stats()."""
+    logger.info(f"{label} index stats: {stats.get('total_vector_count', 0)} total vectors")
+    if PINECONE_NAMESPACE in stats.get("namespaces", {}):
+        ns_count = stats["namespaces"][PINECONE_NAMESPACE].get("vector_count", 0)
+        logger.info(f"{label} '{PINECONE_NAMESPACE}' namespace: {ns_count} vectors")
+
+
+def upload_to_pinecone(limit=None, dry_run=False, show_stats=False, skip_unchanged=False):
     """Upload embeddings to Pinecone."""
     
     logger.info("=" * 60)
@@ -302,39 +682,47 @@ def upload_to_pinecone(limit=None, dry_run=False):
     logger.info(f"Pinecone settings:")
     logger.info(f"  Index: {PINECONE_INDEX}")
     logger.info(f"  Namespace: {PINECONE_NAMESPACE}")
-    logger.info(f"  Batch size: {PINECONE_BATCH_SIZE}")
+    logger.info(f"  Batch size: up to {PINECONE_BATCH_SIZE} vectors / {MAX_UPSERT_BYTES / 1024 / 1024:.1f}MB")
     
     # Load embeddings
-    if not EMBEDDINGS_FILE.exists():
-        logger.error(f"Embeddings file not found: {EMBEDDINGS_FILE}")
-        logger.error("Run 05_generate_embeddings_v2.py first")
-        return
-    
-    logger.info(f"Loading embeddings from {EMBEDDINGS_FILE}")
-    with open(EMBEDDINGS_FILE, 'r') as f:
-        embeddings_data = json.load(f)
+    for path in (EMBEDDINGS_FILE, EMBEDDINGS_META_FILE, EMBEDDINGS_VECTORS_FILE):
+        if not path.exists():
+            logger.error(f"Embeddings file not found: {path}")
+            logger.error("Run 05_generate_embeddings_v2.py first")
+            return
     
-    chunks = embeddings_data.get("chunks", [])
-    logger.info(f"Loaded {len(chunks)} chunks with embeddings")
+    # Chunks are streamed from the JSONL as they are uploaded, so the total
+    # comes from Step 05's meta. Not the vector row count: repeated texts
+    # share a row, and a crashed run can leave rows no record points at
+    logger.info(f"Streaming embeddings from {EMBEDDINGS_FILE}")
+    vectors = load_vectors()
+    total = load_meta()["total_chunks"]
+    logger.info(f"Found {total} chunks with embeddings ({vectors.dtype} vectors)")
+    chunks = iter_embeddings()
     
     # Apply limit
     if limit:
-        chunks = chunks[:limit]
+        chunks = itertools.islice(chunks, limit)
+        total = min(total, limit)
         logger.info(f"Limit mode: uploading first {limit} chunks")
     
-    if not chunks:
+    if not total:
         logger.info("No chunks to upload!")
         return
     
     if dry_run:
         logger.info("")
         logger.info("DRY RUN - No actual upload will occur")
-        logger.info(f"Would upload {len(chunks)} vectors to:")
+        logger.info(f"Would upload {total} vectors to:")
         logger.info(f"  Index: {PINECONE_INDEX}")
         logger.info(f"  Namespace: {PINECONE_NAMESPACE}")
         
         # Show sample
-        sample = prepare_vector(chunks[0])
+        first = next(chunks, None)
+        if first is None:
+            logger.warning(f"No records found in {EMBEDDINGS_FILE} (Step 05 may have been interrupted)")
+            return
+        sample = prepare_vector(first, vector_values([first], vectors)[0])
         logger.info("")
         logger.info("Sample vector:")
         logger.info(f"  ID: {sample['id']}")
@@ -343,65 +731,120 @@ def upload_to_pinecone(limit=None, dry_run=False):
         return
     
     # Initialize Pinecone
-    logger.info(f"Connecting to Pinecone index: {PINECONE_INDEX}")
+    use_grpc = grpc_available()
+    logger.info(f"Connecting to Pinecone index: {PINECONE_INDEX} ({'gRPC' if use_grpc else 'REST'})")
+    if not use_grpc:
+        logger.info("For faster uploads over gRPC, run: pip install 'pinecone[grpc]'")
     try:
-        index = get_pinecone_index()
+        index = get_pinecone_index(use_grpc=use_grpc)
     except Exception as e:
         logger.error(f"Failed to connect to Pinecone: {e}")
         return
+    if use_grpc:
+        bytes_per_value = GRPC_BYTES_PER_VALUE
+    elif vectors.dtype == np.float16:
+        bytes_per_value = JSON_FP16_BYTES_PER_VALUE
+    else:
+        bytes_per_value = JSON_BYTES_PER_VALUE
     
-    # Get current stats
-    stats = index.describe_index_stats()
-    logger.info(f"Current index stats: {stats.get('total_vector_count', 0)} total vectors")
-    
-    if PINECONE_NAMESPACE in stats.get("namespaces", {}):
-        ns_stats = stats["namespaces"][PINECONE_NAMESPACE]
-        logger.info(f"Current '{PINECONE_NAMESPACE}' namespace: {ns_stats.get('vector_count', 0)} vectors")
+    # Current stats cost a round trip, so only when asked for
+    if show_stats:
+        log_index_stats(index.describe_index_stats(), "Current")
     
-    # Upload in batches
-    total_batches = (len(chunks) + PINECONE_BATCH_SIZE - 1) // PINECONE_BATCH_SIZE
-    stats_upload = {"uploaded": 0, "failed": 0}
+    # Upload in batches, MAX_INFLIGHT_UPSERTS at a time
+    stats_upload = {"uploaded": 0, "skipped": 0, "failed": 0}
     
     start_time = datetime.now()
     
-    for batch_idx in range(0, len(chunks), PINECONE_BATCH_SIZE):
-        batch = chunks[batch_idx:batch_idx + PINECONE_BATCH_SIZE]
-        batch_num = batch_idx // PINECONE_BATCH_SIZE + 1
+    # One thread prepares batches while the executor uploads them
+    pool = None
+    if PREPARE_PROCESSES > 0:
+        logger.info(f"Preparing vectors on {PREPARE_PROCESSES} worker processes")
+        pool = ProcessPoolExecutor(max_workers=PREPARE_PROCESSES, initializer=init_prepare_worker)
+    prepared = queue.Queue(maxsize=PREPARED_BATCHES_AHEAD)
+    producer = threading.Thread(
+        target=prepare_batches,
+        args=(chunks, vectors, prepared, bytes_per_value, pool),
+        daemon=True
+    )
+    producer.start()
+    
+    def record(batch_num, batch_size, error=None, skipped=0):
+        label = f"[Batch {batch_num}]" if batch_num else "[Prepare]"
+        if error is None:
+            stats_upload["uploaded"] += batch_size - skipped
+            stats_upload["skipped"] += skipped
+            unchanged = f", skipped {skipped} unchanged" if skipped else ""
+            logger.info(
+                f"{label} ✓ Uploaded {batch_size - skipped} vectors{unchanged} "
+                f"({stats_upload['uploaded'] + stats_upload['skipped']}/{total})"
+            )
+        else:
+            logger.error(f"{label} ✗ Error: {error}")
+            stats_upload["failed"] += batch_size
+    
+    with ThreadPoolExecutor(max_workers=MAX_INFLIGHT_UPSERTS) as executor:
+        inflight = {}
+        exhausted = False
+        read_error = None
         
-        try:
-            # Prepare vectors
-            vectors = [prepare_vector(chunk) for chunk in batch]
-            
-            # Upsert to Pinecone
-            index.upsert(vectors=vectors, namespace=PINECONE_NAMESPACE)
-            
-            stats_upload["uploaded"] += len(vectors)
-            logger.info(f"[Batch {batch_num}/{total_batches}] ✓ Uploaded {len(vectors)} vectors")
-            
-        except Exception as e:
-            logger.error(f"[Batch {batch_num}/{total_batches}] ✗ Error: {e}")
-            stats_upload["failed"] += len(batch)
+        def submit_next():
+            nonlocal exhausted, read_error
+            while not exhausted:
+                item = prepared.get()
+                if item is None or isinstance(item, Exception):
+                    exhausted = True
+                    read_error = item
+                elif isinstance(item[2], Exception):
+                    record(*item)
+                else:
+                    inflight[executor.submit(upload_batch, index, item[2], skip_unchanged)] = item
+                    return
+        
+        for _ in range(MAX_INFLIGHT_UPSERTS):
+            submit_next()
+        
+        # Handle batches in whatever order they finish, refilling as each one does
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_num, batch_size, _ = inflight.pop(future)
+                error = future.exception()
+                record(batch_num, batch_size, error, 0 if error else future.result())
+                submit_next()
+    producer.join()
+    if pool is not None:
+        pool.shutdown()
+    
+    # Chunks the producer never got to are failures too
+    if read_error is not None:
+        handled = stats_upload["uploaded"] + stats_upload["skipped"] + stats_upload["failed"]
+        logger.error(f"Stopped reading embeddings: {type(read_error).__name__}: {read_error}")
+        logger.error(f"{max(total - handled, 0)} remaining chunks were not uploaded")
+        stats_upload["failed"] += max(total - handled, 0)
     
     # Final stats
     elapsed = (datetime.now() - start_time).total_seconds()
     
-    # Get updated stats
-    final_stats = index.describe_index_stats()
-    
     logger.info("")
     logger.info("=" * 60)
-    logger.info("UPLOAD COMPLETE")
+    logger.info("UPLOAD INCOMPLETE" if read_error is not None else "UPLOAD COMPLETE")
     logger.info("=" * 60)
     logger.info(f"Time elapsed: {elapsed:.2f} seconds")
     logger.info(f"Vectors uploaded: {stats_upload['uploaded']}")
+    if skip_unchanged:
+        logger.info(f"Skipped (unchanged): {stats_upload['skipped']}")
     logger.info(f"Failed: {stats_upload['failed']}")
     logger.info(f"Index: {PINECONE_INDEX}")
     logger.info(f"Namespace: {PINECONE_NAMESPACE}")
-    logger.info(f"Total vectors in index: {final_stats.get('total_vector_count', 0)}")
     
-    if PINECONE_NAMESPACE in final_stats.get("namespaces", {}):
-        ns_count = final_stats["namespaces"][PINECONE_NAMESPACE].get("vector_count", 0)
-        logger.info(f"Vectors in '{PINECONE_NAMESPACE}' namespace: {ns_count}")
+    # Pinecone updates its counts shortly after an upsert, so these can lag
+    if show_stats:
+        log_index_stats(index.describe_index_stats(), "Final")
+    
+    # Non-zero exit so a scheduled run shows up as failed
+    if read_error is not None:
+        sys.exit(1)
 
 
 def delete_namespace():
@@ -426,14 +869,38 @@ def delete_namespace():
     logger.info(f"✓ Deleted all vectors in namespace '{PINECONE_NAMESPACE}'")
 
 
-def test_search(query=None):
-    """Test search in the configured namespace."""
+@functools.lru_cache(maxsize=None)
+def get_openai_client():
+    """
+    Return the OpenAI client used for query embeddings, built on first use.
     
-    # Default query uses channel name
-    if query is None:
-        query = f"What does {CHANNEL_DISPLAY_NAME} say about faith?"
+    It is kept for the life of the process over a keep-alive HTTP/2
+    connection, so repeated test searches skip the TCP and TLS setup.
+    """
+    import httpx
+    from openai import OpenAI
+    
+    http_client = httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT),
+    )
+    return OpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+
+
+def test_search(queries=None):
+    """
+    Test search in the configured namespace.
     
-    logger.info(f"Testing search with query: {query}")
+    `queries` is one query string or a list of them. All the query
+    embeddings come from a single OpenAI call, and the Pinecone queries
+    run concurrently; results are logged in the order given.
+    """
+    
+    # Default query uses channel name
+    if queries is None:
+        queries = [f"What does {CHANNEL_DISPLAY_NAME} say about faith?"]
+    elif isinstance(queries, str):
+        queries = [queries]
     
     # Validate OpenAI key for generating query embedding
     if not OPENAI_API_KEY:
@@ -441,20 +908,19 @@ def test_search(query=None):
         return
     
     try:
-        from openai import OpenAI
+        openai_client = get_openai_client()
     except ImportError:
         logger.error("OpenAI package not installed!")
-        logger.error("Run: pip install openai")
+        logger.error("Run: pip install openai 'httpx[http2]'")
         return
     
-    # Generate query embedding
-    logger.info(f"Generating query embedding with {EMBEDDING_MODEL}...")
-    openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    # Generate all query embeddings in one request
+    logger.info(f"Generating {len(queries)} query embedding(s) with {EMBEDDING_MODEL}...")
     response = openai_client.embeddings.create(
         model=EMBEDDING_MODEL,
-        input=query
+        input=queries
     )
-    query_embedding = response.data[0].embedding
+    query_embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
     
     # Search Pinecone
     try:
@@ -464,29 +930,42 @@ def test_search(query=None):
         return
     
     logger.info(f"Searching in index '{PINECONE_INDEX}', namespace '{PINECONE_NAMESPACE}'...")
-    results = index.query(
-        vector=query_embedding,
-        top_k=5,
-        include_metadata=True,
-        namespace=PINECONE_NAMESPACE
-    )
-    
-    matches = results.get("matches", [])
-    
-    if not matches:
-        logger.info("No results found!")
-        return
-    
-    logger.info(f"\nTop {len(matches)} results:")
-    logger.info("-" * 60)
-    
-    for i, match in enumerate(matches, 1):
-        meta = match.get("metadata", {})
-        logger.info(f"\n{i}. Score: {match['score']:.4f}")
-        logger.info(f"   Video: {meta.get('video_title', 'N/A')}")
-        logger.info(f"   Time: {meta.get('start_timestamp', 'N/A')} - {meta.get('end_timestamp', 'N/A')}")
-        logger.info(f"   Text: {meta.get('text', 'N/A')[:150]}...")
-        logger.info(f"   Link: {meta.get('youtube_url', 'N/A')}")
+    with ThreadPoolExecutor(max_workers=min(len(queries), MAX_CONCURRENT_QUERIES)) as executor:
+        futures = [
+            executor.submit(
+                index.query,
+                vector=query_embedding,
+                top_k=5,
+                include_metadata=True,
+                namespace=PINECONE_NAMESPACE
+            )
+            for query_embedding in query_embeddings
+        ]
+        
+        for query, future in zip(queries, futures):
+            logger.info(f"\nQuery: {query}")
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Search failed: {e}")
+                continue
+            
+            matches = results.get("matches", [])
+            
+            if not matches:
+                logger.info("No results found!")
+                continue
+            
+            logger.info(f"Top {len(matches)} results:")
+            logger.info("-" * 60)
+            
+            for i, match in enumerate(matches, 1):
+                meta = match.get("metadata", {})
+                logger.info(f"\n{i}. Score: {match['score']:.4f}")
+                logger.info(f"   Video: {meta.get('video_title', 'N/A')}")
+                logger.info(f"   Time: {meta.get('start_timestamp', 'N/A')} - {meta.get('end_timestamp', 'N/A')}")
+                logger.info(f"   Text: {meta.get('text', 'N/A')[:150]}...")
+                logger.info(f"   Link: {meta.get('youtube_url', 'N/A')}")
 
 
 # =============================================================================
@@ -503,9 +982,12 @@ Examples:
     python 06_upload_to_pinecone_v2.py                  # Upload all embeddings
     python 06_upload_to_pinecone_v2.py --limit 100      # Upload first 100 chunks
     python 06_upload_to_pinecone_v2.py --dry-run        # Preview without uploading
+    python 06_upload_to_pinecone_v2.py --show-stats     # Log index counts before/after
+    python 06_upload_to_pinecone_v2.py --skip-unchanged # Only upsert new/changed chunks
     python 06_upload_to_pinecone_v2.py --delete-all     # Delete all vectors in namespace
     python 06_upload_to_pinecone_v2.py --test           # Test search after upload
     python 06_upload_to_pinecone_v2.py --test --query "your query"
+    python 06_upload_to_pinecone_v2.py --test --query "one" --query "two"
         """
     )
     
@@ -521,6 +1003,18 @@ Examples:
         help='Show what would be uploaded without actually uploading'
     )
     
+    parser.add_argument(
+        '--show-stats',
+        action='store_true',
+        help='Log index vector counts before and after the upload'
+    )
+    
+    parser.add_argument(
+        '--skip-unchanged',
+        action='store_true',
+        help='Fetch each batch first and leave out chunks whose stored content hash matches'
+    )
+    
     parser.add_argument(
         '--delete-all',
         action='store_true',
@@ -536,7 +1030,8 @@ Examples:
     parser.add_argument(
         '--query',
         type=str,
-        help='Custom query for test search (use with --test)'
+        action='append',
+        help='Custom query for test search (use with --test; repeat for several)'
     )
     
     return parser.parse_args()
@@ -562,7 +1057,12 @@ if __name__ == "__main__":
             logger.info("Cancelled")
     
     elif args.test:
-        test_search(query=args.query)
+        test_search(queries=args.query)
     
     else:
-        upload_to_pinecone(limit=args.limit, dry_run=args.dry_run)
+        upload_to_pinecone(
+            limit=args.limit,
+            dry_run=args.dry_run,
+            show_stats=args.show_stats,
+            skip_unchanged=args.skip_unchanged,
+        )